@@ -1,9 +1,20 @@
+import asyncio
+import atexit
+import contextvars
+import functools
+import importlib
+import inspect
+import json
 import logging
+import logging.handlers
 import os
-import asyncio
-from typing import Optional
+import queue
+import string
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from pathlib import Path
-from dotenv import load_dotenv
 from livekit import rtc
 from livekit.agents import (
     Agent,
@@ -16,36 +27,308 @@ from livekit.agents import (
     function_tool,
     RunContext,
 )
-from livekit.plugins import (
-    noise_cancellation,
-    silero,
-)
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
+from cache import CachedMCPClient, RequestCoalescer, SemanticSearchCache, ToolResultCache
 from config import get_config
-from mcp_client import get_mcp_client
-from prompts import SYSTEM_PROMPT
+from mcp_client import MCPClient, get_mcp_client
+from prompts import SYSTEM_PROMPT, compact_prompt
 from room_manager import get_room_manager
-from web_server import run_web_server
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # falls back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger("agent")
 stt_logger = logging.getLogger("stt")
 language_logger = logging.getLogger("language_detection")
 
-load_dotenv()
-
 ROOT = Path(__file__).resolve().parents[2]
 
+# Console mode (`python agent.py console`) has no room to publish an avatar to
+IS_CONSOLE = "console" in sys.argv
+
+# Installed at import time so the spawned job processes (which import this
+# module) run their voice pipeline on uvloop as well as the CLI process.
+# USE_UVLOOP=false falls back to the stdlib loop (.env is already loaded: the
+# config import above runs load_dotenv, so the flag can live in .env)
+USE_UVLOOP = uvloop is not None and os.getenv("USE_UVLOOP", "true").lower() in ("1", "true", "yes")
+if USE_UVLOOP:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Shared across sessions in this worker process: repeated / paraphrased
+# semantic_search calls skip the embedding + Qdrant round-trip
+semantic_search_cache = SemanticSearchCache(maxsize=256, ttl=600.0, similarity_threshold=0.92)
+
+# Semantic searches the LLM fires together in one turn are batched: embeddings
+# within a window go out in one API call, searches in one Qdrant request
+SEARCH_BATCH_WINDOW = 0.01  # seconds per stage (embed, search)
+SEARCH_MAX_BATCH = 8
+
+
+@functools.cache
+def get_mcp_executor() -> ThreadPoolExecutor:
+    """
+    Dedicated, bounded pool for blocking MCP (PostgreSQL/Qdrant/embedding) calls so
+    tool bursts cannot starve the loop's default executor used by livekit itself.
+    Sized by ConfigManager.get_mcp_pool_size() (MCP_POOL) on first use
+    """
+    executor = ThreadPoolExecutor(max_workers=get_config().get_mcp_pool_size(), thread_name_prefix="mcp")
+    atexit.register(executor.shutdown, wait=False, cancel_futures=True)
+    return executor
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking call on the MCP executor (like asyncio.to_thread, incl. contextvars)"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(get_mcp_executor(), functools.partial(ctx.run, func, *args))
+
+
+# =========================================================================
+# MCP TOOL DECORATOR - Shared dispatch, formatting and error handling
+# =========================================================================
+
+def _compact(value: Any, drop: Tuple[str, ...]) -> Any:
+    """Strip internal keys and null values from result rows before serializing"""
+    if isinstance(value, dict):
+        return {k: v for k, v in value.items() if v is not None and k not in drop}
+    if isinstance(value, list):
+        return [_compact(item, drop) for item in value]
+    return value
+
+
+# Built once: json.dumps() with non-default options constructs a new encoder per call
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _to_json(value: Any, drop: Tuple[str, ...] = ()) -> str:
+    """Serialize a result payload as compact JSON (fewer LLM tokens than repr)"""
+    if orjson is not None:
+        # Same output shape as _JSON_ENCODER (compact, UTF-8, str() fallback)
+        return orjson.dumps(_compact(value, drop), default=str, option=_ORJSON_OPTIONS).decode()
+    return _JSON_ENCODER.encode(_compact(value, drop))
+
+
+# Default cap on rows serialized into one tool message (bounds LLM context growth)
+MAX_TOOL_RESULTS = 10
+
+
+def _format_result(result: Dict[str, Any], fields: Dict[str, Any], found: str,
+                   empty: Optional[str], key: str, error: str,
+                   render: Optional[Callable[[Any], str]], drop: Tuple[str, ...],
+                   limit: Optional[int]) -> str:
+    """Render an MCP status dict into the message returned to the LLM"""
+    if result['status'] != 'success':
+        return error.format(error=result.get('error'))
+
+    value = result.get(key, [] if empty is not None else {})
+    omitted = 0
+    if empty is not None:
+        if not value:
+            return empty.format_map(fields)
+        fields['count'] = len(value)
+        if limit is not None and len(value) > limit:
+            omitted = len(value) - limit
+            value = value[:limit]
+    fields[key] = render(value) if render is not None else _to_json(value, drop)
+    message = found.format_map(fields)
+    if omitted:
+        message += f" ({omitted} more not shown; ask a narrower question)"
+    return message
+
+
+# Seconds a tool call may take before the LLM gets an error instead
+MCP_TOOL_TIMEOUT = 8.0
+
+
+class CircuitBreaker:
+    """
+    Fail fast after repeated tool failures instead of queueing more slow calls
+
+    Opens after `threshold` consecutive failures and rejects calls for
+    `cooldown` seconds. The breaker is then half-open: exactly one call is
+    let through as a trial while the others are still rejected. A failure
+    reopens immediately, a success closes the breaker, and a trial that never
+    reports back frees the next trial after another cooldown.
+    """
+
+    __slots__ = ("threshold", "cooldown", "failures", "open_until")
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now"""
+        now = time.monotonic()
+        if now < self.open_until:
+            return False
+        if self.open_until:
+            # Half-open: this call is the trial; hold the rest back until it records
+            self.open_until = now + self.cooldown
+        return True
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of a call"""
+        if ok:
+            self.failures = 0
+            self.open_until = 0.0
+            return
+        self.failures += 1
+        if self.failures >= self.threshold or self.open_until:
+            self.open_until = time.monotonic() + self.cooldown
+            self.failures = 0
+
+    def reset(self) -> None:
+        self.failures = 0
+        self.open_until = 0.0
+
+
+# Tool names registered through @mcp_tool, in definition order
+MCP_TOOL_NAMES: List[str] = []
+
+# One breaker per tool, shared by every session in the worker process
+MCP_TOOL_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+_TEMPLATE_PARSER = string.Formatter()
+
+
+def mcp_tool(found: str, empty: Optional[str] = None, key: str = "results",
+             error: str = "Error: {error}", render: Optional[Callable[[Any], str]] = None,
+             drop: Tuple[str, ...] = (), limit: Optional[int] = MAX_TOOL_RESULTS,
+             via: Optional[str] = None):
+    """
+    Turn an Assistant method stub into an MCP-backed tool
+
+    The decorated method only provides the tool's signature and docstring (used by
+    @function_tool for the schema). Its arguments after the RunContext are passed
+    positionally to the MCPClient method of the same name; the blocking call and
+    the message formatting run together in a single worker-thread hop.
+    Each call is capped at MCP_TOOL_TIMEOUT and guarded by a per-tool
+    CircuitBreaker, so a degraded database yields fast errors, not a backlog.
+
+    Args:
+        found: Message template for a successful result; fields are the tool
+               arguments, `key` and `count`
+        empty: Message template when `key` is empty (None for single-object results)
+        key: Result dict key holding the payload
+        error: Message template for an error status; field `error`
+        render: Optional callable converting the payload before formatting
+                (default: compact JSON)
+        drop: Payload keys the LLM does not need (stripped before serializing)
+        limit: Maximum number of rows serialized (None for no cap); `count`
+               still reports the full total
+        via: Name of an Assistant coroutine method to call instead of MCPClient
+             (bypasses the MCP tool result caches)
+    """
+    def decorator(func):
+        # Introspect once at class definition, not per call
+        name = func.__name__
+        signature = inspect.signature(func)
+        arg_names = tuple(signature.parameters)[2:]  # skip self and the RunContext
+        MCP_TOOL_NAMES.append(name)
+        breaker = MCP_TOOL_BREAKERS[name] = CircuitBreaker()
+
+        # Check the message templates against the tool signature at import time,
+        # so a misspelt field fails loudly instead of on the first live call
+        for template, allowed in (
+            (found, {*arg_names, key, "count"}),
+            (empty or "", set(arg_names)),
+            (error, {"error"}),
+        ):
+            unknown = {field for _, field, _, _ in _TEMPLATE_PARSER.parse(template)
+                       if field is not None and field not in allowed}
+            if unknown:
+                raise ValueError(f"mcp_tool {name}: unknown template field(s) {sorted(unknown)}")
+
+        def _run_sync(method: Callable[..., Dict[str, Any]], fields: Dict[str, Any]) -> Tuple[bool, str]:
+            # CachedMCPClient (when wrapped) serves repeats from memory, then sqlite
+            result = method(*fields.values())
+            ok = result['status'] == 'success'
+            return ok, _format_result(result, fields, found, empty, key, error, render, drop, limit)
+
+        async def _call(self, fields: Dict[str, Any]) -> Tuple[bool, str]:
+            if via is not None:
+                result = await getattr(self, via)(*fields.values())
+                ok = result['status'] == 'success'
+                return ok, _format_result(result, fields, found, empty, key, error, render, drop, limit)
+            # MCPClient blocks on DB I/O: call and format in one thread hop
+            return await run_blocking(_run_sync, getattr(self._mcp_client, name), fields)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not breaker.allow():
+                return f"Error: {name} is temporarily unavailable, please try again shortly"
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            # Trim LLM-supplied strings once at ingress: the MCP call, the cache
+            # keys and the reply all see the same value
+            fields = {
+                arg: arguments[arg].strip() if isinstance(arguments[arg], str) else arguments[arg]
+                for arg in arg_names
+            }
+            try:
+                # A timed-out call keeps its worker thread until the DB returns;
+                # the breaker stops new calls from piling up behind it
+                ok, message = await asyncio.wait_for(_call(self, fields), timeout=MCP_TOOL_TIMEOUT)
+                breaker.record(ok)
+                return message
+            except asyncio.TimeoutError:
+                breaker.record(False)
+                logger.warning("%s timed out after %.0fs", name, MCP_TOOL_TIMEOUT)
+                return f"Error: {name} timed out"
+            except Exception as e:
+                breaker.record(False)
+                logger.exception("Error in %s", name)
+                return f"Error: {str(e)}"
+
+        return wrapper
+    return decorator
+
 
 class Assistant(Agent):
+    # Agent keeps per-session state (chat context, activity), so one instance is
+    # built per session; the shared clients it holds come from prewarm()
+
+    # Resolved once at import; Agent stores the string as-is and does not tokenize it.
+    # Compacted because the instructions are re-sent to the LLM on every turn
+    INSTRUCTIONS: str = compact_prompt(SYSTEM_PROMPT)
+
     def __init__(self, mcp_client=None, room_manager=None) -> None:
+        self._embedder = RequestCoalescer(
+            # Native async: the embedding API call does not occupy an MCP worker
+            single=lambda query: self._mcp_client.aembed_query(query),
+            batch=lambda queries: self._mcp_client.aembed_queries(queries),
+            window=SEARCH_BATCH_WINDOW,
+            max_batch=SEARCH_MAX_BATCH,
+        )
+        self._searcher = RequestCoalescer(
+            single=lambda request: run_blocking(self._mcp_client.semantic_search, *request),
+            batch=lambda requests: run_blocking(
+                self._mcp_client.semantic_search_batch, *map(list, zip(*requests))
+            ),
+            window=SEARCH_BATCH_WINDOW,
+            max_batch=SEARCH_MAX_BATCH,
+        )
+
         if mcp_client is not None:
             self._mcp_client = mcp_client
         else:
             try:
                 self._mcp_client = get_mcp_client()
             except Exception as e:
-                logger.warning(f"Failed to initialize MCP client in __init__: {e}")
+                logger.warning("Failed to initialize MCP client in __init__: %s", e)
                 self._mcp_client = None
 
         if room_manager is not None:
@@ -54,11 +337,11 @@ class Assistant(Agent):
             try:
                 self._room_manager = get_room_manager()
             except Exception as e:
-                logger.warning(f"Failed to initialize room_manager in __init__: {e}")
+                logger.warning("Failed to initialize room_manager in __init__: %s", e)
                 self._room_manager = None
 
         super().__init__(
-            instructions=SYSTEM_PROMPT,
+            instructions=self.INSTRUCTIONS,
         )
 
     @property
@@ -67,7 +350,7 @@ class Assistant(Agent):
             try:
                 self._mcp_client = get_mcp_client()
             except Exception as e:
-                logger.warning(f"Failed to initialize MCP client on demand: {e}")
+                logger.warning("Failed to initialize MCP client on demand: %s", e)
                 return None
         return self._mcp_client    
 
@@ -89,238 +372,114 @@ class Assistant(Agent):
         return self._room_manager
 
     # =========================================================================
-    # NON-BLOCKING MCP TOOL CALLS - Use asyncio.to_thread() for all sync calls
+    # NON-BLOCKING MCP TOOL CALLS - Dispatched via @mcp_tool on the MCP executor
     # =========================================================================
 
     @function_tool
+    @mcp_tool(found="Summary: {summary}", key="summary",
+              error="Error retrieving CV summary: {error}")
     async def get_cv_summary(self, _: RunContext) -> str:
         """Get a high-level summary of the person's CV including role, experience, and key stats."""
-        try:
-            # Run synchronous MCP call in a thread pool to avoid blocking
-            result = await asyncio.to_thread(self._mcp_client.get_cv_summary)
-            if result['status'] == 'success':
-                summary = result.get('summary', {})
-                return f"Summary: {summary}"
-            else:
-                return f"Error retrieving CV summary: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in get_cv_summary: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} job(s) at {company_name}: {results}",
+              empty="No experience found at {company_name}")
     async def search_company_experience(self, _: RunContext, company_name: str) -> str:
         """Find all work experience at a specific company."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_company_experience, company_name
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} job(s) at {company_name}: {results}"
-                else:
-                    return f"No experience found at {company_name}"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_company_experience: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} job(s) between {start_year}-{end_year}: {results}",
+              empty="No work experience found between {start_year} and {end_year}")
     async def search_work_by_date(self, _: RunContext, start_year: int, end_year: int) -> str:
         """Find work experience within a date range."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_work_by_date, start_year, end_year
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} job(s) between {start_year}-{end_year}: {results}"
-                else:
-                    return f"No work experience found between {start_year} and {end_year}"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_work_by_date: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} job(s) using {technology}: {results}",
+              empty="No experience found with {technology}")
     async def search_technology_experience(self, _: RunContext, technology: str) -> str:
         """Find all jobs using a specific technology."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_technology_experience, technology
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} job(s) using {technology}: {results}"
-                else:
-                    return f"No experience found with {technology}"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_technology_experience: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    async def search_experience(self, context: RunContext, company_name: Optional[str] = None,
+                                technology: Optional[str] = None) -> str:
+        """Find work experience by company and technology together, in one call."""
+        lookups = []
+        if company_name:
+            lookups.append(self.search_company_experience(context, company_name))
+        if technology:
+            lookups.append(self.search_technology_experience(context, technology))
+        if not lookups:
+            return "Please provide a company name, a technology, or both"
+
+        # Both lookups run concurrently; each tool formats its own errors
+        results = await asyncio.gather(*lookups)
+        return "\n".join(results)
+
+    @function_tool
+    @mcp_tool(found="Found {count} education record(s): {results}",
+              empty="No education records found")
     async def search_education(self, _: RunContext, institution: Optional[str] = None, degree: Optional[str] = None) -> str:
         """Find education records by institution or degree type."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_education, institution, degree
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} education record(s): {results}"
-                else:
-                    return f"No education records found"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_education: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} publication(s): {results}",
+              empty="No publications found")
     async def search_publications(self, _: RunContext, year: Optional[int] = None) -> str:
         """Search publications by year or get all publications."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_publications, year
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} publication(s): {results}"
-                else:
-                    return f"No publications found"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_publications: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Skills in {category}: {results}",
+              empty="No skills found in category {category}", limit=None,
+              render=lambda results: ', '.join(r.get('skill_name') for r in results))
     async def search_skills(self, _: RunContext, category: str) -> str:
         """Find skills by category (AI, ML, programming, Tools, Cloud, Data_tools)."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_skills, category
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    skills = [r.get('skill_name') for r in results]
-                    return f"Skills in {category}: {', '.join(skills)}"
-                else:
-                    return f"No skills found in category {category}"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_skills: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} award(s)/certification(s): {results}",
+              empty="No awards or certifications found")
     async def search_awards_certifications(self, _: RunContext, award_type: Optional[str] = None) -> str:
         """Find awards and certifications records."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_awards_certifications, award_type
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} award(s)/certification(s): {results}"
-                else:
-                    return f"No awards or certifications found"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_awards_certifications: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} relevant result(s): {results}",
+              empty="No relevant results found for your query",
+              drop=("chunk_id", "cv_id"), via="_cached_semantic_search")
     async def semantic_search(self, _: RunContext, query: str, section: Optional[str] = None, top_k: int = 5) -> str:
         """Perform semantic search on CV content using vector embeddings."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.semantic_search, query, section, top_k
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} relevant result(s): {results}"
-                else:
-                    return f"No relevant results found for your query"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in semantic_search: {e}")
-            return f"Error: {str(e)}"
+
+    async def _cached_semantic_search(self, query: str, section: Optional[str], top_k: int) -> Dict[str, Any]:
+        return await semantic_search_cache.get_or_compute(
+            query,
+            section,
+            top_k,
+            embed=lambda q: self._embedder.submit(q, q),
+            compute=lambda vector: self._searcher.submit(
+                (query, section, top_k), (query, section, top_k, vector)
+            ),
+        )
 
     @function_tool
+    @mcp_tool(found="Found {count} work experience record(s): {results}",
+              empty="No work experience records found", limit=None)
     async def get_all_work_experience(self, _: RunContext) -> str:
         """Get complete work experience history - all jobs in chronological order. Use this for general experience, career history, or all jobs queries."""
-        try:
-            result = await asyncio.to_thread(self._mcp_client.get_all_work_experience)
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} work experience record(s): {results}"
-                else:
-                    return "No work experience records found"
-            else:
-                return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in get_all_work_experience: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} language(s): {results}",
+              empty="No language records found")
     async def search_languages(self, _: RunContext, language: Optional[str] = None) -> str:
         """Find languages spoken and proficiency levels."""
-        try:
-            result = await asyncio.to_thread(self._mcp_client.search_languages, language)
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} language(s): {results}"
-                return "No language records found"
-            return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_languages: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Contact info: {data}", key="data")
     async def get_contact_info(self, _: RunContext) -> str:
         """Get contact information: email, LinkedIn, and GitHub."""
-        try:
-            result = await asyncio.to_thread(self._mcp_client.get_contact_info)
-            if result['status'] == 'success':
-                data = result.get('data', {})
-                return f"Contact info: {data}"
-            return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in get_contact_info: {e}")
-            return f"Error: {str(e)}"
 
     @function_tool
+    @mcp_tool(found="Found {count} reference(s): {results}",
+              empty="No work references found")
     async def search_work_references(self, _: RunContext, reference_name: Optional[str] = None, company: Optional[str] = None) -> str:
         """Find professional work references by name or company."""
-        try:
-            result = await asyncio.to_thread(
-                self._mcp_client.search_work_references, reference_name, company
-            )
-            if result['status'] == 'success':
-                results = result.get('results', [])
-                if results:
-                    return f"Found {len(results)} reference(s): {results}"
-                return "No work references found"
-            return f"Error: {result.get('error')}"
-        except Exception as e:
-            logger.error(f"Error in search_work_references: {e}")
-            return f"Error: {str(e)}"
 
     # =========================================================================
     # ROOM MANAGEMENT TOOLS - Already async, no changes needed
@@ -334,7 +493,7 @@ class Assistant(Agent):
             room_name = await rm.create_pattreeya_room(room_name_suffix=room_name_suffix)
             return f"Successfully created room: {room_name}. You can now connect to this room for a voice conversation with Pattreeya."
         except Exception as e:
-            logger.error(f"Error creating pattreeya room: {e}")
+            logger.exception("Error creating pattreeya room: %s", e)
             return f"Failed to create room: {str(e)}"
 
     @function_tool
@@ -349,7 +508,7 @@ class Assistant(Agent):
             else:
                 return "No active pattreeya rooms at the moment."
         except Exception as e:
-            logger.error(f"Error listing pattreeya rooms: {e}")
+            logger.exception("Error listing pattreeya rooms: %s", e)
             return f"Failed to list rooms: {str(e)}"
 
     @function_tool
@@ -363,42 +522,175 @@ class Assistant(Agent):
             else:
                 return f"Failed to delete room: {room_name}"
         except Exception as e:
-            logger.error(f"Error deleting pattreeya room: {e}")
+            logger.exception("Error deleting pattreeya room: %s", e)
             return f"Failed to delete room: {str(e)}"
 
+    @function_tool
+    async def manage_pattreeya_rooms(self, context: RunContext, actions: List[str]) -> str:
+        """Run several room operations at once. Each action is "list", "create", "create:<suffix>" or "delete:<room_name>"."""
+        async def run(action: str) -> str:
+            op, _, arg = action.partition(":")
+            op, arg = op.strip().lower(), arg.strip() or None
+            if op == "list":
+                return await self.list_pattreeya_rooms(context)
+            if op == "create":
+                return await self.create_pattreeya_room(context, arg)
+            if op == "delete" and arg:
+                return await self.delete_pattreeya_room(context, arg)
+            return f"Unknown room action: {action}"
+
+        # Each room tool handles its own errors, so one failure does not cancel the rest
+        results = await asyncio.gather(*(run(action) for action in actions))
+        return " | ".join(f"{action}: {result}" for action, result in zip(actions, results))
+
 
 # =========================================================================
 # SERVER SETUP - Lazy load avatar plugins to save memory
 # =========================================================================
 
+# Background listeners that write STT / language-detection logs (kept referenced)
+_log_listeners: List[logging.handlers.QueueListener] = []
+
+
 def configure_stt_logging():
-    """Configure logging for STT and language detection."""
-    stt_handler = logging.StreamHandler()
-    stt_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - STT - %(levelname)s - %(message)s")
-    )
-    stt_logger.addHandler(stt_handler)
-    stt_logger.setLevel(logging.INFO)
+    """Configure logging for STT and language detection.
 
-    lang_handler = logging.StreamHandler()
-    lang_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - LANG_DETECTION - %(levelname)s - %(message)s")
-    )
-    language_logger.addHandler(lang_handler)
-    language_logger.setLevel(logging.INFO)
+    Records are handed to a QueueHandler and written by a QueueListener thread,
+    so transcription logging never does stderr I/O on the event loop.
+    """
+    if _log_listeners:
+        return
+
+    for target, label in ((stt_logger, "STT"), (language_logger, "LANG_DETECTION")):
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(
+            logging.Formatter(f"%(asctime)s - %(name)s - {label} - %(levelname)s - %(message)s")
+        )
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, stream_handler,
+                                                  respect_handler_level=True)
+        listener.start()
+        _log_listeners.append(listener)
+
+        target.addHandler(logging.handlers.QueueHandler(log_queue))
+        target.setLevel(logging.INFO)
+        target.propagate = False  # written once, by the listener
+
+    atexit.register(_stop_log_listeners)
+
+
+def _stop_log_listeners() -> None:
+    """Flush queued log records on interpreter exit"""
+    while _log_listeners:
+        _log_listeners.pop().stop()
 
 
 from livekit.agents import AgentServer
 server = AgentServer(job_memory_warn_mb=1024, initialize_process_timeout=120.0)
 
 
+def register_plugins():
+    """Import the native-model plugins (registers them with livekit.agents).
+
+    Kept out of module scope so importing agent.py (tests, the __main__ smoke
+    test) does not load Silero/turn-detector/noise-cancellation code. Must run
+    on the main thread: prewarm() in job processes, before cli.run_app() in the
+    CLI process (needed by `download-files`).
+    """
+    from livekit.plugins import noise_cancellation, silero  # noqa: F401
+    from livekit.plugins.turn_detector import multilingual  # noqa: F401
+
+
 def prewarm(proc: JobProcess):
-    """Prewarm models and configure logging."""
-    proc.userdata["vad"] = silero.VAD.load()
-    #proc.userdata["turn_detector"] = MultilingualModel()
+    """Prewarm models, shared clients, and configure logging."""
+    register_plugins()
+    from livekit.plugins import silero
+
+    use_gpu = False
+    try:
+        use_gpu = get_config().get_vad_use_gpu()
+    except Exception as e:
+        logger.warning("Config unavailable in prewarm, loading VAD on CPU: %s", e)
+
+    # force_cpu=False lets onnxruntime pick the CUDA provider when available
+    proc.userdata["vad"] = silero.VAD.load(force_cpu=not use_gpu)
+    logger.info("✓ Silero VAD loaded (%s)", "GPU allowed" if use_gpu else "CPU")
+
+    # Import the configured avatar plugin here (main thread, once per process)
+    # instead of inside the first session's connect path
+    try:
+        provider = get_config().get_avatar_provider()
+        if provider in AVATAR_PLUGINS:
+            importlib.import_module(AVATAR_PLUGINS[provider])
+            logger.info("✓ Avatar plugin preloaded: %s", provider)
+    except Exception as e:
+        logger.warning("Avatar plugin preload failed (will import per session): %s", e)
+
+    # Build the MCP client (DB pools, Qdrant, embedding client) and room manager
+    # once per worker process so the first session does not pay for them
+    try:
+        mcp_client = get_mcp_client()
+        mcp_client.warmup()
+        proc.userdata["mcp_client"] = wrap_mcp_client(mcp_client, proc.userdata)
+        logger.info("✓ MCP client prewarmed")
+    except Exception as e:
+        logger.warning("MCP client prewarm failed (will retry per session): %s", e)
+
+    try:
+        proc.userdata["room_manager"] = get_room_manager()
+        logger.info("✓ Room manager prewarmed")
+    except Exception as e:
+        logger.warning("Room manager prewarm failed (will retry per session): %s", e)
+
     configure_stt_logging()
     stt_logger.info("STT logging configured - ready to capture transcriptions")
 
+    atexit.register(close_shared_clients, proc.userdata)
+
+
+def wrap_mcp_client(mcp_client: Any, userdata: Dict[str, Any]) -> CachedMCPClient:
+    """
+    Put the in-memory LRU (and the sqlite cache behind it) in front of an MCPClient
+
+    The sqlite cache is opened once per process and kept in userdata. Its
+    namespace includes the CV id, so re-ingesting the CV starts a fresh
+    keyspace instead of serving the previous CV's rows.
+
+    Args:
+        mcp_client: MCPClient instance to wrap
+        userdata: Job process userdata (holds the shared "tool_cache")
+
+    Returns:
+        CachedMCPClient for the session(s) of this process
+    """
+    config = get_config()
+    tool_cache = userdata.get("tool_cache")
+    if tool_cache is None:
+        try:
+            tool_cache = userdata["tool_cache"] = ToolResultCache(
+                config.get_tool_cache_path(),
+                ttl=config.get_tool_cache_ttl(),
+                namespace=(
+                    f"{config.get_postgresql_url()}|{config.get_qdrant_collection()}"
+                    f"|{getattr(mcp_client, 'cv_id', '')}"
+                ),
+            )
+        except Exception as e:
+            logger.warning("Tool result cache unavailable (results cached in memory only): %s", e)
+    return CachedMCPClient(mcp_client, ttl=config.get_tool_cache_ttl(), persistent=tool_cache)
+
+
+def close_shared_clients(userdata: Dict[str, Any]) -> None:
+    """Close the per-process clients built in prewarm() (runs at process exit)"""
+    for key in ("mcp_client", "tool_cache"):
+        client = userdata.get(key)
+        if client is None:
+            continue
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug("%s close failed: %s", key, e)
+
 
 server.setup_fnc = prewarm
 
@@ -410,63 +702,116 @@ async def cleanup_avatar(avatar):
             await avatar.stop()
             logger.debug("Avatar stopped")
         except Exception as e:
-            logger.debug(f"Avatar cleanup error: {e}")
+            logger.debug("Avatar cleanup error: %s", e)
+
+
+def _tavus_avatar():
+    from livekit.plugins import tavus
+    return tavus.AvatarSession(
+        replica_id="r9d30b0e55ac",
+        persona_id="p9cb09c3c7bc",
+    )
+
+
+SIMLI_API_KEY = os.getenv("SIMLI_API_KEY")
+
+
+def _simli_avatar():
+    from livekit.plugins import simli
+    return simli.AvatarSession(
+        simli_config=simli.SimliConfig(
+            api_key=SIMLI_API_KEY,
+            face_id="cace3ef7-a4c4-425d-a8cf-a5358eb0c427",
+        ),
+    )
+
+
+def _bey_avatar():
+    from livekit.plugins import bey
+    return bey.AvatarSession(
+        avatar_id="694c83e2-8895-4a98-bd16-56332ca3f449",
+    )
+
+
+def _bithuman_avatar():
+    from livekit.plugins import bithuman
+    return bithuman.AvatarSession(
+        model_path=os.path.join(ROOT, "assets", "min_tech_art_dir.imx")
+    )
+
+
+# Provider -> plugin module, imported ahead of time by prewarm()
+AVATAR_PLUGINS: Dict[str, str] = {
+    "tavus": "livekit.plugins.tavus",
+    "simli": "livekit.plugins.simli",
+    "bey": "livekit.plugins.bey",
+    "bit": "livekit.plugins.bithuman",
+}
+
+# Provider -> factory; each factory imports only its own plugin. Avatar sessions
+# are bound to one room, so a new one is built per session.
+AVATAR_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "tavus": _tavus_avatar,
+    "simli": _simli_avatar,
+    "bey": _bey_avatar,
+    "bit": _bithuman_avatar,
+}
+
+
+async def reap_avatar_task(avatar_task: "asyncio.Task") -> Any:
+    """Wait briefly for an avatar start to finish; cancel it if it does not"""
+    try:
+        return await asyncio.wait_for(avatar_task, timeout=5.0)
+    except asyncio.TimeoutError:
+        logger.warning("Avatar task timeout during cleanup, cancelling...")
+        avatar_task.cancel()
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.debug("Avatar task error during cleanup: %s", e)
+    return None
 
 
 async def try_start_avatar(provider: str, session, room, is_console: bool):
     """Try to start avatar, return None on failure - lazy load plugins"""
-    logger.debug(f">>> [8] Attempting to start avatar with provider: {provider}")
+    logger.debug(">>> [8] Attempting to start avatar with provider: %s", provider)
 
-    if provider == "none" or is_console:
+    factory = AVATAR_FACTORIES.get(provider)
+    if factory is None or is_console:
         return None
-    
-    avatar = None
-    
+
     try:
-        match provider:
-            case "tavus":
-                from livekit.plugins import tavus
-                avatar = tavus.AvatarSession(
-                    replica_id="r9d30b0e55ac",
-                    persona_id="p9cb09c3c7bc",
-                )
-            case "simli":
-                from livekit.plugins import simli
-                avatar = simli.AvatarSession(
-                    simli_config=simli.SimliConfig(
-                        api_key=os.getenv("SIMLI_API_KEY"),
-                        face_id="cace3ef7-a4c4-425d-a8cf-a5358eb0c427",
-                    ),
-                )
-            case "bey":
-                from livekit.plugins import bey
-                avatar = bey.AvatarSession(
-                    avatar_id="694c83e2-8895-4a98-bd16-56332ca3f449",
-                )
-            case "bit":
-                from livekit.plugins import bithuman
-                avatar = bithuman.AvatarSession(
-                    model_path=os.path.join(ROOT, "assets", "min_tech_art_dir.imx")
-                )
-            case _:
-                return None
-        
+        avatar = factory()
         await asyncio.wait_for(avatar.start(session, room=room), timeout=5.0)
-        logger.info(f"✓ Avatar started: {provider}")
+        logger.info("✓ Avatar started: %s", provider)
         return avatar
-        
+
     except asyncio.TimeoutError:
         logger.warning("Avatar timed out. Using voice-only.")
         return None
     except Exception as e:
-        logger.warning(f"Avatar failed: {e}. Using voice-only.")
-        return None    
+        logger.warning("Avatar failed: %s. Using voice-only.", e)
+        return None
+
+
+# Strong references to fire-and-forget tasks; the event loop only keeps weak ones
+_BACKGROUND_TASKS: Set["asyncio.Task"] = set()
+
+
+async def warm_embedding_client(mcp_client: Any) -> None:
+    """Open the async embedding client's connection, giving up after MCP_TOOL_TIMEOUT"""
+    try:
+        await asyncio.wait_for(mcp_client.awarmup(), timeout=MCP_TOOL_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Async embedding warmup timed out after %.0fs", MCP_TOOL_TIMEOUT)
 
 
 @server.rtc_session()
 async def my_agent(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name}
-    logger.info(f">>> [1] Agent connected to room: {ctx.room.name}")
+    logger.info(">>> [1] Agent connected to room: %s", ctx.room.name)
+    # Confirms the job loop was not replaced by the CLI / job runner
+    logger.debug("Event loop: %s", type(asyncio.get_running_loop()).__module__)
 
     # Add connection monitoring
     @ctx.room.on("reconnecting")
@@ -477,33 +822,65 @@ async def my_agent(ctx: JobContext):
     def on_reconnected():
         logger.debug("[Connection] Reconnected successfully ✓")
 
-    # Initialize MCP client and room manager
-    mcp_client = None
-    room_manager = None
+    # Open the room signal connection now so its DNS/TLS/WebSocket handshake
+    # overlaps with building the session; session.start() reuses it
+    # (JobContext.connect() is idempotent)
+    connect_task = asyncio.create_task(ctx.connect())
 
-    try:
-        mcp_client = get_mcp_client()
+    # Reuse the MCP client and room manager built in prewarm()
+    mcp_client = ctx.proc.userdata.get("mcp_client")
+    room_manager = ctx.proc.userdata.get("room_manager")
+
+    if mcp_client is None:
+        try:
+            mcp_client = wrap_mcp_client(get_mcp_client(), ctx.proc.userdata)
+            ctx.proc.userdata["mcp_client"] = mcp_client
+        except Exception as e:
+            logger.warning("MCP client failed (will continue without): %s", e)
+    if mcp_client is not None:
         logger.debug(">>> [5a] MCP client ready")
-    except Exception as e:
-        logger.warning(f"MCP client failed (will continue without): {e}")
 
-    try:
-        room_manager = get_room_manager()
+    if room_manager is None:
+        try:
+            room_manager = get_room_manager()
+            ctx.proc.userdata["room_manager"] = room_manager
+        except Exception as e:
+            logger.warning("Room manager failed (will continue without): %s", e)
+    if room_manager is not None:
         logger.debug(">>> [5b] Room manager ready")
-    except Exception as e:
-        logger.warning(f"Room manager failed (will continue without): {e}")
-
-    logger.debug(">>> [2] Creating AgentSession...")
-    session = AgentSession(
-        stt=inference.STT(model="deepgram/nova-3", language="multi"),
-        llm=inference.LLM(model="openai/gpt-4.1-nano"),
-        tts=inference.TTS(
-            model="cartesia/sonic-3", voice="9626c31c-bec5-4cca-baa8-f8ba9e84c8bc"
-        ),
-        turn_detection=MultilingualModel(),
-        vad=ctx.proc.userdata["vad"],
-        preemptive_generation=True,
-    )
+
+    try:
+        from livekit.plugins import noise_cancellation
+        from livekit.plugins.turn_detector.multilingual import MultilingualModel
+
+        # One turn detector per worker process. It only wraps the process's
+        # inference executor (the ONNX weights live there), so it is shared across
+        # sessions; it cannot be built in prewarm() because it needs a job context
+        turn_detector = ctx.proc.userdata.get("turn_detector")
+        if turn_detector is None:
+            turn_detector = ctx.proc.userdata["turn_detector"] = MultilingualModel()
+
+        logger.debug(">>> [2] Creating AgentSession...")
+        session = AgentSession(
+            stt=inference.STT(model="deepgram/nova-3", language="multi"),
+            llm=inference.LLM(model="openai/gpt-4.1-nano"),
+            tts=inference.TTS(
+                model="cartesia/sonic-3", voice="9626c31c-bec5-4cca-baa8-f8ba9e84c8bc"
+            ),
+            turn_detection=turn_detector,
+            vad=ctx.proc.userdata["vad"],
+            preemptive_generation=True,
+        )
+
+        # Build the agent once, before the avatar task starts, so a failure here
+        # does not leave an avatar session to reap
+        assistant = Assistant(mcp_client=mcp_client, room_manager=room_manager)
+    except BaseException:
+        # Nothing awaits connect_task on this path: cancel and reap it so it is
+        # not left running or logged as "Task exception was never retrieved"
+        connect_task.cancel()
+        await asyncio.gather(connect_task, return_exceptions=True)
+        raise
 
     logger.debug(">>> [7] Checking avatar provider...")
     config = get_config()
@@ -513,61 +890,80 @@ async def my_agent(ctx: JobContext):
             provider=config.get_avatar_provider(),
             session=session,
             room=ctx.room,
-            is_console='console' in __import__('sys').argv
+            is_console=IS_CONSOLE,
         )
     )
 
+    # prewarm() has no event loop for the async embedding client used by
+    # semantic_search; open its connection alongside the session handshakes.
+    # Kept out of the gather below: it is optional and must not hold back the
+    # shutdown callbacks registered after it
+    if mcp_client is not None:
+        warmup_task = asyncio.create_task(warm_embedding_client(mcp_client))
+        _BACKGROUND_TASKS.add(warmup_task)
+        warmup_task.add_done_callback(_BACKGROUND_TASKS.discard)
+
     logger.debug(">>> [9] Starting session.start()...")
-    avatar = None
     try:
-        await session.start(
-            agent=Assistant(mcp_client=mcp_client, room_manager=room_manager),
-            room=ctx.room,
-            room_options=room_io.RoomOptions(
-                audio_input=room_io.AudioInputOptions(
-                    noise_cancellation=lambda params: noise_cancellation.BVCTelephony()
-                    if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
-                    else noise_cancellation.BVC(),
+        # Avatar bring-up overlaps the STT/TTS handshakes; try_start_avatar
+        # never raises (5 s cap, voice-only fallback), so a session error
+        # surfaces here as soon as it happens
+        _, _, avatar = await asyncio.gather(
+            session.start(
+                agent=assistant,
+                room=ctx.room,
+                room_options=room_io.RoomOptions(
+                    audio_input=room_io.AudioInputOptions(
+                        noise_cancellation=lambda params: noise_cancellation.BVCTelephony()
+                        if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
+                        else noise_cancellation.BVC(),
+                    ),
                 ),
             ),
+            connect_task,
+            avatar_task,
         )
+    except asyncio.CancelledError:
+        avatar_task.cancel()
+        raise
     except Exception as e:
         err_name = type(e).__name__
         err_msg = str(e)
         if 'handshake' in err_msg.lower() or 'WSServerHandshake' in err_name or '400' in err_msg:
-            logger.error(f"[INIT] WSServerHandshakeError: session.start() failed — check DEEPGRAM_API_KEY/CARTESIA_API_KEY: {e}")
+            logger.error("[INIT] WSServerHandshakeError: session.start() failed — check DEEPGRAM_API_KEY/CARTESIA_API_KEY: %s", e)
         elif 'timeout' in err_msg.lower() or 'TimeoutError' in err_name:
-            logger.error(f"[INIT] Running init timeout: session.start() timed out — check network/credentials: {e}")
+            logger.error("[INIT] Running init timeout: session.start() timed out — check network/credentials: %s", e)
         else:
-            logger.error(f">>> [ERROR] session.start() failed: {e}")
-        raise
-    finally:
+            logger.error(">>> [ERROR] session.start() failed: %s", e)
+
         logger.debug(">>> [11] Cleanup starting...")
-        try:
-            avatar = await asyncio.wait_for(avatar_task, timeout=5.0)
-        except asyncio.TimeoutError:
-            logger.warning("Avatar task timeout during cleanup, cancelling...")
-            avatar_task.cancel()
-            avatar = None
-        except asyncio.CancelledError:
-            avatar = None
-        except Exception as e:
-            logger.debug(f"Avatar task error during cleanup: {e}")
-            avatar = None
+        await cleanup_avatar(await reap_avatar_task(avatar_task))
+        raise
 
-        await cleanup_avatar(avatar)
+    # The avatar lives as long as the session; stop it when the job ends
+    if avatar is not None:
+        ctx.add_shutdown_callback(functools.partial(cleanup_avatar, avatar))
+    # The LiveKit API session is bound to this job's loop; reopened lazily
+    if room_manager is not None:
+        ctx.add_shutdown_callback(room_manager.aclose)
 
-    logger.info(f"✓ Agent connected to room {ctx.room.name} - ready to listen")
+    if isinstance(mcp_client, CachedMCPClient):
+        logger.debug("MCP tool cache: %s hits, %s misses (process-wide)",
+                     mcp_client.hits, mcp_client.misses)
+    logger.info("✓ Agent connected to room %s - ready to listen", ctx.room.name)
 
 
 if __name__ == "__main__":
-    try:
-        logger.info("Initializing Assistant...")
-        assistant = Assistant()
-        logger.info("✓ Assistant initialized successfully")
+    # Static smoke test: check every MCP tool maps to an MCPClient method without
+    # building the MCP client / room manager (no network or DB I/O)
+    missing = [name for name in MCP_TOOL_NAMES if not callable(getattr(MCPClient, name, None))]
+    if missing:
+        logger.error("✗ Assistant tools without an MCPClient method: %s", ', '.join(missing))
+    else:
+        logger.info("✓ %s MCP tools registered", len(MCP_TOOL_NAMES))
         logger.info("✓ Agent is ready to serve")
-    except Exception as e:
-        logger.error(f"✗ Failed to initialize Assistant: {e}")
+
+    from web_server import run_web_server
 
     try:
         config = get_config()
@@ -582,29 +978,73 @@ if __name__ == "__main__":
         )
         logger.info("✓ API server started on http://0.0.0.0:8019")
     except Exception as e:
-        logger.warning(f"API server initialization failed (agent will still run): {e}")
+        logger.warning("API server initialization failed (agent will still run): %s", e)
 
+    import socket
     import subprocess
+    import threading
     import time
     from pathlib import Path
 
+    def wait_for_port(host: str, port: int, timeout: float = 30.0) -> bool:
+        """Poll until a TCP port accepts connections (backoff 50 ms -> 1 s)"""
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((host, port), timeout=0.2):
+                    return True
+            except OSError:
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+        return False
+
+    def report_next_ready(started: float) -> None:
+        if wait_for_port("127.0.0.1", 3000):
+            logger.info("✓ Next.js server ready on http://0.0.0.0:3000 (%.1fs)",
+                        time.monotonic() - started)
+        else:
+            logger.warning("Next.js server did not open port 3000 within 30s")
+
+    # START_NEXTJS=false when the frontend runs under its own supervisor
+    # (systemd, compose); download-files never needs it
+    start_nextjs = (
+        os.getenv("START_NEXTJS", "true").lower() in ("1", "true", "yes")
+        and "download-files" not in sys.argv
+    )
+
     try:
         web_dir = Path(__file__).parent.parent / "web"
-        if (web_dir / ".next").exists():
+        if not start_nextjs:
+            logger.info("Next.js server not started by the agent")
+        elif (web_dir / ".next").exists():
             logger.info("Starting Next.js production server on port 3000...")
-            next_process = subprocess.Popen(
-                ["pnpm", "start"],
-                cwd=str(web_dir),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            time.sleep(3)
-            logger.info("✓ Next.js server started on http://0.0.0.0:3000")
+            # Write output straight to a file: undrained pipes fill up (~64 KB)
+            # and block the Next.js process on write()
+            next_log_path = web_dir / ".next" / "server.log"
+            with open(next_log_path, "ab") as next_log:
+                next_process = subprocess.Popen(
+                    ["pnpm", "start"],
+                    cwd=str(web_dir),
+                    stdin=subprocess.DEVNULL,
+                    stdout=next_log,
+                    stderr=subprocess.STDOUT,
+                )
+            logger.info("Next.js output is written to %s", next_log_path)
+            # Don't leave an orphaned frontend behind when the agent exits
+            atexit.register(next_process.terminate)
+            # The agent does not depend on the frontend: report readiness in the
+            # background instead of delaying cli.run_app()
+            threading.Thread(
+                target=report_next_ready, args=(time.monotonic(),),
+                name="next-ready", daemon=True,
+            ).start()
         else:
             logger.warning(
                 "Next.js build output not found. To build the frontend, run: cd web && pnpm build"
             )
     except Exception as e:
-        logger.warning(f"Failed to start Next.js server: {e}")
+        logger.warning("Failed to start Next.js server: %s", e)
 
+    register_plugins()
     cli.run_app(server)
\ No newline at end of file
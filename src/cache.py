@@ -0,0 +1,895 @@
+"""
+Caching layer for Voice Agent tool calls
+Keeps repeated and paraphrased MCP tool calls off the embedding/vector DB path
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# SEMANTIC SEARCH CACHE
+# ============================================================================
+
+class SemanticSearchCache:
+    """
+    Two-level cache in front of the semantic_search MCP tool
+
+    Handles:
+    - Exact-match LRU keyed on sha256(query|section|top_k)
+    - Semantic hits for paraphrased queries via cosine similarity of query embeddings
+      (one matmul over a preallocated embedding matrix)
+    - TTL eviction to bound staleness
+    - Coalescing of concurrent identical searches into one computation
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0,
+                 similarity_threshold: float = 0.92, dtype: Any = np.float16):
+        """
+        Initialize semantic search cache
+
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds before a cached result expires
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            dtype: Storage dtype of cached embeddings (float16 halves memory; scores
+                   are still accumulated in float32)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.dtype = np.dtype(dtype)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # Embeddings live in one preallocated (maxsize, dim) matrix so a semantic
+        # lookup is a single matmul instead of re-stacking every entry per probe
+        self._matrix: Optional[np.ndarray] = None
+        self._scores: Optional[np.ndarray] = None
+        self._slot_keys: List[Optional[str]] = [None] * maxsize
+        self._slot_groups = np.full(maxsize, -1, dtype=np.int64)
+        self._free_slots: List[int] = list(range(maxsize - 1, -1, -1))
+        self._groups: Dict[tuple, int] = {}
+
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(query: str, section: Optional[str], top_k: int) -> str:
+        """Build the exact-match cache key for a search"""
+        raw = f"{query.strip().lower()}|{section or 'all'}|{top_k}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        """Convert an embedding to a unit-length float32 vector"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return now - entry["created_at"] > self.ttl
+
+    def _group_id(self, section: Optional[str], top_k: int) -> int:
+        """Map a (section, top_k) pair to a small integer for slot masking"""
+        group = (section or "all", top_k)
+        if group not in self._groups:
+            self._groups[group] = len(self._groups)
+        return self._groups[group]
+
+    def _store_embedding(self, key: str, embedding: Optional[np.ndarray],
+                         section: Optional[str], top_k: int) -> Optional[int]:
+        """Copy an embedding into a free matrix slot and return the slot index"""
+        if embedding is None or not self._free_slots:
+            return None
+        if self._matrix is None:
+            self._matrix = np.zeros((self.maxsize, embedding.shape[0]), dtype=self.dtype)
+            self._scores = np.empty(self.maxsize, dtype=np.float32)
+        elif embedding.shape[0] != self._matrix.shape[1]:
+            return None
+
+        slot = self._free_slots.pop()
+        self._matrix[slot] = embedding
+        self._slot_keys[slot] = key
+        self._slot_groups[slot] = self._group_id(section, top_k)
+        return slot
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and release its matrix slot"""
+        entry = self._entries.pop(key)
+        slot = entry["slot"]
+        if slot is not None:
+            self._slot_keys[slot] = None
+            self._slot_groups[slot] = -1
+            self._free_slots.append(slot)
+
+    def _evict_expired(self, now: float) -> None:
+        """Remove expired entries (oldest first)"""
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if not self._is_expired(entry, now):
+                break
+            self._remove(key)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up an exact-match result
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached result, or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry, time.monotonic()):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry["result"]
+
+    def get_similar(self, embedding: np.ndarray, section: Optional[str],
+                    top_k: int) -> Optional[Any]:
+        """
+        Look up a result for a paraphrased query
+
+        Args:
+            embedding: Normalized query embedding
+            section: Section filter of the search
+            top_k: Number of results requested
+
+        Returns:
+            Cached result of the most similar query above the threshold, or None
+        """
+        entry = self._similar_entry(embedding, section, top_k)
+        return entry["result"] if entry is not None else None
+
+    def _similar_entry(self, embedding: np.ndarray, section: Optional[str],
+                       top_k: int) -> Optional[Dict[str, Any]]:
+        """Entry of the most similar live query above the threshold (see get_similar)"""
+        now = time.monotonic()
+        self._evict_expired(now)
+        group = self._groups.get((section or "all", top_k))
+        if self._matrix is None or group is None or embedding.shape[0] != self._matrix.shape[1]:
+            return None
+
+        # Accumulate in float32 into a reused buffer whatever the storage dtype;
+        # fp16 rounding (~1e-3) is far below the similarity threshold margin
+        scores = np.einsum("nd,d->n", self._matrix, embedding, dtype=np.float32,
+                           out=self._scores)
+        np.putmask(scores, self._slot_groups != group, -np.inf)
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+
+        key = self._slot_keys[best]
+        entry = self._entries[key]
+        # LRU order is not age order, so the sweep above can stop short of it
+        if self._is_expired(entry, now):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, result: Any, embedding: Optional[np.ndarray] = None,
+            section: Optional[str] = None, top_k: int = 5,
+            created_at: Optional[float] = None) -> None:
+        """
+        Store a result in the cache
+
+        Args:
+            key: Cache key from make_key()
+            result: Tool result to cache
+            embedding: Normalized query embedding (enables semantic hits)
+            section: Section filter of the search
+            top_k: Number of results requested
+            created_at: time.monotonic() of when the result was computed
+                        (defaults to now)
+        """
+        if key in self._entries:
+            self._remove(key)
+        while self._entries and len(self._entries) >= self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+        self._entries[key] = {
+            "result": result,
+            "slot": self._store_embedding(key, embedding, section, top_k),
+            "section": section or "all",
+            "top_k": top_k,
+            "created_at": time.monotonic() if created_at is None else created_at,
+        }
+
+    async def get_or_compute(
+        self,
+        query: str,
+        section: Optional[str],
+        top_k: int,
+        embed: Callable[[str], Awaitable[List[float]]],
+        compute: Callable[[Optional[List[float]]], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Return a cached semantic_search result or compute and cache a new one
+
+        Concurrent calls for the same key (e.g. a preemptive and a final LLM
+        generation issuing the same search) share one in-flight computation.
+
+        Args:
+            query: Natural language search query
+            section: Section filter
+            top_k: Number of results
+            embed: Coroutine function returning the query embedding
+            compute: Coroutine function running the search; receives the raw
+                     query embedding (or None) so it is not computed twice
+
+        Returns:
+            semantic_search result dict
+        """
+        key = self.make_key(query, section, top_k)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._compute(key, query, section, top_k, embed, compute))
+        self._inflight[key] = task
+        task.add_done_callback(functools.partial(self._forget_inflight, key))
+        # Shielded so cancelling this caller (e.g. a dropped preemptive
+        # generation) leaves the search running for the coalesced waiters
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: "asyncio.Future[Dict[str, Any]]") -> None:
+        """Drop a finished computation from the in-flight map"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _compute(
+        self,
+        key: str,
+        query: str,
+        section: Optional[str],
+        top_k: int,
+        embed: Callable[[str], Awaitable[List[float]]],
+        compute: Callable[[Optional[List[float]]], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Embed, probe the semantic layer, and run the search on a miss"""
+        raw_embedding = None
+        embedding = None
+        try:
+            raw_embedding = await embed(query)
+            embedding = self._normalize(raw_embedding)
+        except Exception as e:
+            logger.warning("Query embedding failed, using exact-match cache only: %s", e)
+            raw_embedding = None
+
+        if embedding is not None:
+            similar = self._similar_entry(embedding, section, top_k)
+            if similar is not None:
+                self.semantic_hits += 1
+                # Keep the source's age: a chain of paraphrases must not keep
+                # one result alive past the TTL
+                self.put(key, similar["result"], embedding, section, top_k,
+                         created_at=similar["created_at"])
+                return similar["result"]
+
+        self.misses += 1
+        result = await compute(raw_embedding if embedding is not None else None)
+        if isinstance(result, dict) and result.get("status") == "success":
+            self.put(key, result, embedding, section, top_k)
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        for key in list(self._entries):
+            self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ============================================================================
+# REQUEST COALESCING
+# ============================================================================
+
+class RequestCoalescer:
+    """
+    Batch concurrent calls that arrive within a short window into one call
+
+    The first submit() opens a window of `window` seconds; everything submitted
+    before it closes (or until `max_batch` distinct keys are pending) is sent
+    in one `batch` call. Duplicate keys within a window share one result.
+    A window holding a single request goes through `single` instead.
+    """
+
+    def __init__(self, single: Callable[[Any], Awaitable[Any]],
+                 batch: Callable[[List[Any]], Awaitable[List[Any]]],
+                 window: float = 0.02, max_batch: int = 8):
+        """
+        Initialize the coalescer
+
+        Args:
+            single: Awaitable callable for a lone request payload
+            batch: Awaitable callable mapping a list of payloads to aligned results
+            window: Seconds to wait for more requests after the first one
+            max_batch: Flush as soon as this many distinct requests are pending
+        """
+        self.single = single
+        self.batch = batch
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: "OrderedDict[Any, Tuple[Any, asyncio.Future]]" = OrderedDict()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+        self.batches = 0
+        self.deduplicated = 0
+
+    async def submit(self, key: Any, payload: Any) -> Any:
+        """
+        Queue a request and wait for its result
+
+        Args:
+            key: Hashable identity used to deduplicate requests within a window
+            payload: Value passed to `single` / included in the `batch` list
+
+        Returns:
+            The result for this request
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.deduplicated += 1
+            future = pending[1]
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = (payload, future)
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._flush)
+        # Shielded so one cancelled caller does not cancel a shared result
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Dispatch everything queued in the current window"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, OrderedDict()
+        task = asyncio.ensure_future(self._dispatch(list(pending.values())))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run one single/batch call and resolve the waiting futures"""
+        futures = [future for _, future in pending]
+        try:
+            if len(pending) == 1:
+                results = [await self.single(pending[0][0])]
+            else:
+                self.batches += 1
+                results = await self.batch([payload for payload, _ in pending])
+                if len(results) != len(futures):
+                    raise ValueError(
+                        f"batch returned {len(results)} results for {len(futures)} requests"
+                    )
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            self._fail(futures, e)
+        finally:
+            # Cancellation (or any BaseException) skips the branch above; no caller
+            # may be left waiting for a result that will never come
+            self._fail(futures, RuntimeError("Coalesced request was not completed"))
+
+    @staticmethod
+    def _fail(futures: List[asyncio.Future], error: BaseException) -> None:
+        """Set an exception on every future that has no result yet"""
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+                future.exception()  # mark retrieved if every caller has gone
+
+
+# ============================================================================
+# IN-MEMORY MCP CLIENT CACHE
+# ============================================================================
+
+class CachedMCPClient:
+    """
+    Proxy around MCPClient that memoizes deterministic tool calls
+
+    Handles:
+    - Exact-match LRU keyed on (tool name, normalized arguments)
+    - Optional persistent ToolResultCache tier behind the LRU, so a new worker
+      process does not start cold; both tiers share one TTL
+    - Per-tool TTL so CV edits show up within minutes without a restart
+    - Whitespace trimming of string arguments (also applied to the real call)
+    - Case folding of the key for tools that match with ILIKE
+    - Thread safety (tools are called from asyncio.to_thread workers)
+
+    semantic_search / embed_query and any other attribute pass through unchanged;
+    semantic_search has its own SemanticSearchCache.
+    """
+
+    CACHED_TOOLS = frozenset({
+        "get_cv_summary",
+        "search_company_experience",
+        "search_technology_experience",
+        "search_work_by_date",
+        "search_education",
+        "search_publications",
+        "search_skills",
+        "search_awards_certifications",
+        "get_all_work_experience",
+        "search_languages",
+        "get_contact_info",
+        "search_work_references",
+    })
+
+    # Tools whose string filters use ILIKE, so "TechCorp" and "techcorp" match alike
+    CASE_INSENSITIVE_TOOLS = frozenset({
+        "search_company_experience",
+        "search_education",
+        "search_awards_certifications",
+        "search_languages",
+        "search_work_references",
+    })
+
+    def __init__(self, client: Any, maxsize: int = 256, ttl: float = 300.0,
+                 tool_ttls: Optional[Dict[str, float]] = None,
+                 persistent: Optional["ToolResultCache"] = None):
+        """
+        Initialize cached MCP client
+
+        Args:
+            client: MCPClient instance to wrap
+            maxsize: Maximum number of cached tool results
+            ttl: Default seconds a cached result stays valid (in both tiers)
+            tool_ttls: Per-tool TTL overrides, by tool name
+            persistent: Cross-process cache consulted after an LRU miss
+        """
+        self._client = client
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.tool_ttls = dict(tool_ttls or {})
+        self.persistent = persistent
+        self._results: "OrderedDict[tuple, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name not in self.CACHED_TOOLS:
+            return attr
+
+        def cached_tool(*args: Any) -> Dict[str, Any]:
+            return self._call(name, attr, args)
+
+        cached_tool.__name__ = name
+        # Bind once: later lookups find the wrapper in the instance __dict__
+        # and skip __getattr__ (and the closure allocation) entirely
+        self.__dict__[name] = cached_tool
+        return cached_tool
+
+    def _call(self, name: str, method: Callable[..., Dict[str, Any]],
+              args: tuple) -> Dict[str, Any]:
+        """Serve a tool call from the LRU, then the persistent tier, else run it"""
+        args = tuple(arg.strip() if isinstance(arg, str) else arg for arg in args)
+        key = self.make_key(name, args)
+
+        now = time.monotonic()
+        ttl = self.tool_ttls.get(name, self.ttl)
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._results[key]
+            self.misses += 1
+
+        if self.persistent is not None:
+            stored = self.persistent.get_entry(name, list(key[1:]), ttl=ttl)
+            if stored is not None:
+                result, age = stored
+                # Keep the original write time: the LRU copy expires with the row
+                self._remember(key, result, now + ttl - age)
+                return result
+
+        result = method(*args)
+        if isinstance(result, dict) and result.get("status") == "success":
+            self._remember(key, result, now + ttl)
+            if self.persistent is not None:
+                self.persistent.put(name, list(key[1:]), result)
+        return result
+
+    @classmethod
+    def make_key(cls, name: str, args: tuple) -> tuple:
+        """
+        Build the cache key for a tool call (shared by the LRU and sqlite tiers)
+
+        Args:
+            name: MCP tool name
+            args: Stripped positional tool arguments
+
+        Returns:
+            (name, *args), with strings casefolded for ILIKE-backed tools
+        """
+        if name in cls.CASE_INSENSITIVE_TOOLS:
+            args = tuple(arg.casefold() if isinstance(arg, str) else arg for arg in args)
+        return (name,) + args
+
+    def _remember(self, key: tuple, result: Dict[str, Any], expires_at: float) -> None:
+        """Insert a result into the LRU, evicting the oldest entries"""
+        with self._lock:
+            self._results[key] = (result, expires_at)
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+# ============================================================================
+# PERSISTENT EMBEDDING CACHE
+# ============================================================================
+
+def _open_sqlite(path: Optional[str], schema: str, label: str) -> Optional[sqlite3.Connection]:
+    """
+    Open (and create) a cache database shared across threads
+
+    Args:
+        path: SQLite database file path (None or empty disables the cache)
+        schema: CREATE statements for the cache table (semicolon-separated)
+        label: Cache name used in log messages
+
+    Returns:
+        Open connection, or None if disabled/unavailable
+    """
+    if not path:
+        logger.info("%s disabled", label)
+        return None
+
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.executescript(schema)
+        logger.info("%s ready at %s", label, path)
+        return conn
+    except (sqlite3.Error, OSError, TypeError) as e:
+        logger.warning("%s unavailable, continuing without cache: %s", label, e)
+        return None
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache of text embeddings shared across sessions and restarts
+
+    Handles:
+    - Lookup by sha256(model + text) so repeated queries skip the embedding API
+    - In-memory LRU of recent embeddings in front of the database (no SQL or
+      BLOB decoding for queries repeated within the process); it has its own
+      lock, so an event-loop probe never waits behind a sqlite read or commit
+    - Batched lookups/stores for several texts at once
+    - Graceful degradation (disabled) if the database file cannot be opened
+    """
+
+    def __init__(self, path: Optional[str], model: str, memory_size: int = 512):
+        """
+        Initialize embedding cache
+
+        Args:
+            path: SQLite database file path (None or empty disables the cache)
+            model: Embedding model name, part of every key
+            memory_size: Number of recent embeddings kept in memory
+        """
+        self.model = model
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._conn = _open_sqlite(
+            path,
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "hash TEXT PRIMARY KEY, vec BLOB NOT NULL, ts INTEGER NOT NULL)",
+            "Embedding cache",
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def _hash(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\n{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: Sequence[str], memory_only: bool = False) -> List[Optional[List[float]]]:
+        """
+        Look up cached embeddings
+
+        Args:
+            texts: Texts to look up
+            memory_only: Probe only the in-memory LRU (safe on the event loop)
+
+        Returns:
+            List aligned with texts: embedding, or None on miss
+        """
+        if not self.enabled or not texts:
+            return [None] * len(texts)
+
+        hashes = [self._hash(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        with self._memory_lock:
+            for h in hashes:
+                vec = self._memory.get(h)
+                if vec is not None:
+                    self._memory.move_to_end(h)
+                    found[h] = vec
+
+        remaining = [h for h in dict.fromkeys(hashes) if h not in found]
+        if remaining and not memory_only:
+            try:
+                placeholders = ",".join("?" * len(remaining))
+                with self._lock:
+                    rows = self._conn.execute(
+                        f"SELECT hash, vec FROM cache WHERE hash IN ({placeholders})",
+                        remaining,
+                    ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache lookup failed: %s", e)
+                rows = []
+            with self._memory_lock:
+                for h, vec in rows:
+                    found[h] = np.frombuffer(vec, dtype=np.float32).tolist()
+                    self._remember(h, found[h])
+
+        return [found.get(h) for h in hashes]
+
+    def _remember(self, h: str, vec: List[float]) -> None:
+        """Insert into the in-memory LRU (caller holds the memory lock)"""
+        self._memory[h] = vec
+        self._memory.move_to_end(h)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def put_many(self, texts: Sequence[str], embeddings: Sequence[List[float]]) -> None:
+        """
+        Store embeddings
+
+        Args:
+            texts: Embedded texts
+            embeddings: Embeddings aligned with texts
+        """
+        if not self.enabled or not texts:
+            return
+
+        now = int(time.time())
+        hashes = [self._hash(text) for text in texts]
+        rows = [
+            (h, np.asarray(vec, dtype=np.float32).tobytes(), now)
+            for h, vec in zip(hashes, embeddings)
+        ]
+        with self._memory_lock:
+            for h, vec in zip(hashes, embeddings):
+                self._remember(h, list(vec))
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (hash, vec, ts) VALUES (?, ?, ?)", rows
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache store failed: %s", e)
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+            with self._memory_lock:
+                self._memory.clear()
+
+
+# ============================================================================
+# PERSISTENT TOOL RESULT CACHE
+# ============================================================================
+
+class ToolResultCache:
+    """
+    SQLite-backed cache of successful MCP tool results shared across sessions
+
+    Handles:
+    - Lookup by sha256(namespace, tool name, arguments)
+    - TTL expiry (CV data changes rarely, but is re-ingested occasionally)
+    - Purge of expired rows on open and at most once per TTL on store, so
+      LLM-chosen arguments cannot grow the file without bound
+    - Graceful degradation (disabled) if the database file cannot be opened
+    """
+
+    def __init__(self, path: Optional[str], ttl: float = 300.0, namespace: str = ""):
+        """
+        Initialize tool result cache
+
+        Args:
+            path: SQLite database file path (None or empty disables the cache)
+            ttl: Seconds before a cached result expires
+            namespace: Data source identifier, part of every key so caches of
+                       different databases/collections/CV ingestions never mix
+        """
+        self.ttl = ttl
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+        self._conn = _open_sqlite(
+            path,
+            "CREATE TABLE IF NOT EXISTS tool_cache ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, ts INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS tool_cache_ts ON tool_cache (ts)",
+            "Tool result cache",
+        )
+        self.purge_expired()
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def make_key(self, tool_name: str, args: Any) -> str:
+        """Build the cache key for a tool call"""
+        raw = json.dumps([self.namespace, tool_name, args], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, tool_name: str, args: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached tool result
+
+        Args:
+            tool_name: MCP tool name
+            args: Tool arguments (any JSON-serializable value)
+
+        Returns:
+            Cached result dict, or None on miss/expiry
+        """
+        entry = self.get_entry(tool_name, args)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, tool_name: str, args: Any,
+                  ttl: Optional[float] = None) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Look up a cached tool result together with its age
+
+        Args:
+            tool_name: MCP tool name
+            args: Tool arguments (any JSON-serializable value)
+            ttl: Expiry override in seconds (defaults to self.ttl)
+
+        Returns:
+            (result dict, age in seconds), or None on miss/expiry
+        """
+        if not self.enabled:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT result, ts FROM tool_cache WHERE key = ? AND ts >= ?",
+                    (self.make_key(tool_name, args), int(now - (self.ttl if ttl is None else ttl))),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Tool result cache lookup failed: %s", e)
+            return None
+        if not row:
+            return None
+        result = orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+        return result, max(0.0, now - row[1])
+
+    def put(self, tool_name: str, args: Any, result: Dict[str, Any]) -> None:
+        """
+        Store a successful tool result
+
+        Args:
+            tool_name: MCP tool name
+            args: Tool arguments (any JSON-serializable value)
+            result: Tool result dict (only status == "success" is stored)
+        """
+        if not self.enabled or result.get("status") != "success":
+            return
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+            else:
+                payload = json.dumps(result, ensure_ascii=False, default=str)
+            now = time.time()
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tool_cache (key, result, ts) VALUES (?, ?, ?)",
+                    (self.make_key(tool_name, args), payload, int(now)),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Tool result cache store failed: %s", e)
+            return
+        if now >= self._next_purge:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """
+        Delete rows older than the TTL
+
+        Returns:
+            Number of rows deleted
+        """
+        if not self.enabled:
+            return 0
+        now = time.time()
+        self._next_purge = now + max(self.ttl, 1.0)
+        try:
+            with self._lock:
+                deleted = self._conn.execute(
+                    "DELETE FROM tool_cache WHERE ts < ?", (int(now - self.ttl),)
+                ).rowcount
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Tool result cache purge failed: %s", e)
+            return 0
+        if deleted:
+            logger.debug("Purged %d expired tool results", deleted)
+        return deleted
+
+    def clear(self) -> None:
+        """Remove all cached results (e.g. after re-ingesting the CV)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.execute("DELETE FROM tool_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
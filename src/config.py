@@ -3,8 +3,8 @@ Configuration management for Voice Agent
 Loads environment variables from .env files and provides centralized config access
 """
 
+import functools
 import os
-from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env files (.env.local takes precedence)
@@ -42,7 +42,29 @@ from exceptions import (
 class ConfigManager:
     """Centralized configuration management for the voice agent"""
 
-    _instance: Optional["ConfigManager"] = None
+    # Settings are read once from the environment in __init__ and never change;
+    # slots keep getter lookups off the instance __dict__
+    __slots__ = (
+        "livekit_url",
+        "livekit_api_key",
+        "livekit_api_secret",
+        "openai_api_key",
+        "llm_model",
+        "embedding_model",
+        "embedding_cache_path",
+        "tool_cache_path",
+        "tool_cache_ttl",
+        "postgresql_url",
+        "db_pool_min",
+        "db_pool_max",
+        "db_prepared_statements",
+        "mcp_pool_size",
+        "qdrant_url",
+        "qdrant_api_key",
+        "qdrant_collection",
+        "avatar_provider",
+        "vad_use_gpu",
+    )
 
     def __init__(self):
         """Initialize configuration from environment variables"""
@@ -55,9 +77,25 @@ class ConfigManager:
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.llm_model = os.getenv("LLM_MODEL", "openai/gpt-4.1-nano")
         self.embedding_model = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        self.embedding_cache_path = os.getenv(
+            "EMBEDDING_CACHE_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "pattreeya-voice-agent", "embeddings.db"),
+        )
+        self.tool_cache_path = os.getenv(
+            "TOOL_CACHE_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "pattreeya-voice-agent", "tools.db"),
+        )
+        self.tool_cache_ttl = float(os.getenv("TOOL_CACHE_TTL", "300"))
 
         # PostgreSQL configuration
         self.postgresql_url = os.getenv("POSTGRESQL_URL")
+        self.db_pool_min = int(os.getenv("DB_POOL_MIN", "1"))
+        self.db_pool_max = int(os.getenv("DB_POOL_MAX", "10"))
+        # Set to false behind a transaction-pooling proxy (e.g. PgBouncer in
+        # transaction mode), where a session's prepared statements do not persist
+        self.db_prepared_statements = os.getenv("DB_PREPARED_STATEMENTS", "true").lower() in ("1", "true", "yes")
+        # Threads for blocking MCP tool calls (PostgreSQL/Qdrant/embeddings)
+        self.mcp_pool_size = int(os.getenv("MCP_POOL", "4"))
 
         # Qdrant Vector Database configuration
         self.qdrant_url = os.getenv("QDRANT_URL")
@@ -65,6 +103,10 @@ class ConfigManager:
         self.qdrant_collection = os.getenv("COLLECTION_NAME", "pt_cv")
 
         self.avatar_provider = os.getenv("AVATAR_PROVIDER", "none")
+
+        # Voice activity detection: set VAD_USE_GPU=true on CUDA workers
+        self.vad_use_gpu = os.getenv("VAD_USE_GPU", "false").lower() in ("1", "true", "yes")
+
         # Validate required configuration
         self._validate_config()
         self._warn_optional()
@@ -125,11 +167,39 @@ class ConfigManager:
         """Get embedding model name"""
         return self.embedding_model
 
+    def get_embedding_cache_path(self) -> str:
+        """Get embedding cache database path (empty string disables the cache)"""
+        return self.embedding_cache_path
+
+    def get_tool_cache_path(self) -> str:
+        """Get tool result cache database path (empty string disables the cache)"""
+        return self.tool_cache_path
+
+    def get_tool_cache_ttl(self) -> float:
+        """Get tool result cache TTL in seconds (shared by the in-memory and sqlite tiers)"""
+        return self.tool_cache_ttl
+
     # Database getters
     def get_postgresql_url(self) -> str:
         """Get PostgreSQL connection URL"""
         return self.postgresql_url
 
+    def get_db_pool_min(self) -> int:
+        """Get number of PostgreSQL connections kept open in the pool"""
+        return self.db_pool_min
+
+    def get_db_pool_max(self) -> int:
+        """Get maximum number of pooled PostgreSQL connections"""
+        return self.db_pool_max
+
+    def get_db_prepared_statements(self) -> bool:
+        """Get whether hot queries run as server-side prepared statements"""
+        return self.db_prepared_statements
+
+    def get_mcp_pool_size(self) -> int:
+        """Get number of worker threads for blocking MCP tool calls"""
+        return self.mcp_pool_size
+
     def get_qdrant_url(self) -> str:
         """Get Qdrant server URL"""
         return self.qdrant_url
@@ -146,22 +216,15 @@ class ConfigManager:
         """Get Avatar provider name"""
         return self.avatar_provider
 
-    @classmethod
-    def get_instance(cls) -> "ConfigManager":
-        """Get or create singleton instance"""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
-
-    @classmethod
-    def reset_instance(cls) -> None:
-        """Reset singleton instance (for testing)"""
-        cls._instance = None
+    def get_vad_use_gpu(self) -> bool:
+        """Get whether Silero VAD may run on the GPU (onnxruntime CUDA provider)"""
+        return self.vad_use_gpu
 
 
+@functools.cache
 def get_config() -> ConfigManager:
-    """Get the global configuration instance"""
-    return ConfigManager.get_instance()
+    """Get the global configuration instance (get_config.cache_clear() resets it)"""
+    return ConfigManager()
 
 
 if __name__ == "__main__":
@@ -4,17 +4,34 @@ Provides abstraction for PostgreSQL and Qdrant vector DB operations
 Centralizes connection management, query execution, and error handling
 """
 
+import functools
+import io
+import itertools
+import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import threading
+import uuid
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from contextlib import contextmanager
 
 import psycopg2
-from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2 import errorcodes, sql
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, parse_dsn
+from psycopg2.extras import execute_batch, execute_values, register_default_json, register_default_jsonb
+from psycopg2.pool import ThreadedConnectionPool
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue, PayloadSchemaType
+)
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+try:
+    import orjson
+except ImportError:  # optional: json/jsonb columns fall back to json.loads
+    orjson = None
+
 from config import ConfigManager, get_config
 from exceptions import (
     DatabaseConnectionError,
@@ -29,6 +46,213 @@ from exceptions import (
 logger = logging.getLogger(__name__)
 # Logging level will be configured by config.configure_logging() at application startup
 
+# "VALUES %s" marks a query written for execute_values (one placeholder for all rows)
+_VALUES_PLACEHOLDER = re.compile(r"\bVALUES\s+%s", re.IGNORECASE)
+
+# Indexes behind the DatabaseTools lookups (created by create_search_indexes,
+# which DatabaseTools.warmup() runs at worker start). Trigram GIN indexes serve
+# the ILIKE '%term%' filters as index scans. A term shorter than 3 characters
+# has no trigrams, so the index cannot narrow it; the planner then falls back
+# to scanning the CV's rows, which is still correct (and cheap for one CV).
+_SEARCH_INDEXES = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_work_company_trgm ON work_experience USING GIN (company gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_education_institution_trgm ON education USING GIN (institution gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_education_degree_trgm ON education USING GIN (degree gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_awards_title_trgm ON awards_certifications USING GIN (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_awards_issuer_trgm "
+    "ON awards_certifications USING GIN (issuing_organization gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_awards_organization_trgm "
+    "ON awards_certifications USING GIN (organization gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_languages_language_trgm ON languages USING GIN (language gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_references_name_trgm ON work_references USING GIN (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_references_company_trgm ON work_references USING GIN (company gin_trgm_ops)",
+)
+
+# psycopg2 placeholders, rewritten to $1..$n for PREPARE
+_PYFORMAT_PLACEHOLDER = re.compile(r"%[s%]")
+
+# Prepared statement names (ps_1, ps_2, ...), unique per process
+_statement_ids = itertools.count(1)
+
+
+@functools.lru_cache(maxsize=256)
+def _numbered_params(query: str) -> str:
+    """Rewrite a %s-style query with $1..$n placeholders (cached per query)"""
+    numbers = itertools.count(1)
+    return _PYFORMAT_PLACEHOLDER.sub(
+        lambda m: "%" if m.group() == "%%" else f"${next(numbers)}", query
+    )
+
+# DATE columns (and DATE[]) are returned as their ISO text ("2021-03-01")
+# instead of datetime.date: every reader serializes them to JSON anyway
+_DATE_AS_TEXT = psycopg2.extensions.new_type((1082,), "DATE_AS_TEXT", lambda value, cursor: value)
+_DATE_ARRAY_AS_TEXT = psycopg2.extensions.new_array_type((1182,), "DATE_ARRAY_AS_TEXT", _DATE_AS_TEXT)
+
+# NUMERIC as float rather than Decimal: the values (years of experience and
+# the like) need no exact decimal arithmetic, and Decimal is not JSON-native
+_NUMERIC_AS_FLOAT = psycopg2.extensions.new_type(
+    (1700,), "NUMERIC_AS_FLOAT", lambda value, cursor: float(value) if value is not None else None
+)
+
+
+class _Connection(psycopg2.extensions.connection):
+    """psycopg2 connection with this module's typecasters, a reusable cursor and prepared statements"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        psycopg2.extensions.register_type(_DATE_AS_TEXT, self)
+        psycopg2.extensions.register_type(_DATE_ARRAY_AS_TEXT, self)
+        psycopg2.extensions.register_type(_NUMERIC_AS_FLOAT, self)
+        if orjson is not None:
+            register_default_json(self, loads=orjson.loads)
+            register_default_jsonb(self, loads=orjson.loads)
+        self._shared_cursor = None
+        self._prepared: Dict[str, str] = {}  # SQL text -> prepared statement name
+        self._deallocate: List[str] = []  # broken statements to drop before the next PREPARE
+
+    def shared_cursor(self):
+        """
+        Default (client-side) cursor kept for the connection's lifetime
+
+        Pooled connections serve one caller at a time, so every query on the
+        connection can reuse it instead of creating and closing a cursor per
+        call; it is closed together with the connection. Use conn.cursor()
+        for named (server-side) cursors.
+        """
+        if self._shared_cursor is None or self._shared_cursor.closed:
+            self._shared_cursor = self.cursor()
+        return self._shared_cursor
+
+    def execute_prepared(self, cursor, query: str, params: Tuple = None) -> None:
+        """
+        Execute query as a server-side prepared statement
+
+        The first call on this connection PREPAREs the query (it is parsed and
+        planned once per session); later calls only send EXECUTE with the
+        parameters. Ordinary errors (bad input, statement_timeout) keep the
+        statement; it is prepared again only if the server lost it (26000) or
+        its cached plan broke after a schema change (0A000), and a broken one
+        is DEALLOCATEd first so no server-side statement leaks.
+
+        Args:
+            cursor: Cursor of this connection
+            query: SQL query string with %s placeholders
+            params: Query parameters
+        """
+        name = self._prepared.get(query)
+        if name is None:
+            while self._deallocate:
+                cursor.execute(f"DEALLOCATE {self._deallocate.pop()}")
+            name = f"ps_{next(_statement_ids)}"
+            cursor.execute(f"PREPARE {name} AS {_numbered_params(query)}")
+            self._prepared[query] = name
+        try:
+            if params:
+                cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+            else:
+                cursor.execute(f"EXECUTE {name}")
+        except psycopg2.Error as e:
+            if e.pgcode == errorcodes.INVALID_SQL_STATEMENT_NAME:
+                del self._prepared[query]
+            elif e.pgcode == errorcodes.FEATURE_NOT_SUPPORTED:
+                # "cached plan must not change result type": the statement still
+                # exists, but the transaction is aborted, so drop it on next use
+                del self._prepared[query]
+                self._deallocate.append(name)
+            raise
+
+
+# libpq options for every pooled connection: fail fast on unreachable hosts,
+# detect dead peers via TCP keepalives, cap runaway queries at 30 s and pin
+# DateStyle so DATE text is always ISO
+_CONNECT_KWARGS = {
+    "connection_factory": _Connection,
+    "sslmode": "require",
+    "connect_timeout": 5,
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+}
+_SESSION_OPTIONS = "-c statement_timeout=30000 -c datestyle=ISO"
+
+
+def _connect_kwargs(dsn: str) -> Dict[str, Any]:
+    """
+    Connection keyword arguments for a DSN
+
+    A keyword argument replaces the DSN parameter of the same name, so the
+    session options are merged with any options= already in the DSN. The
+    DSN's settings come last, and PostgreSQL applies the last -c for a
+    setting, so settings tuned through POSTGRESQL_URL win over the defaults.
+    """
+    try:
+        dsn_options = parse_dsn(dsn).get("options")
+    except psycopg2.ProgrammingError:
+        dsn_options = None
+    options = f"{_SESSION_OPTIONS} {dsn_options}" if dsn_options else _SESSION_OPTIONS
+    return {**_CONNECT_KWARGS, "options": options}
+
+
+def _column_names(cursor) -> Tuple[str, ...]:
+    """Column names of the cursor's current result"""
+    return tuple(column.name for column in cursor.description)
+
+
+def _fetch_dicts(cursor) -> List[Dict[str, Any]]:
+    """
+    Fetch all rows as dicts keyed by column name
+
+    Cheaper than RealDictCursor, which fills each row dict one column at a
+    time from Python; here the tuple rows come straight from libpq and each
+    dict is built in a single dict(zip(...)).
+    """
+    rows = cursor.fetchall()
+    if not rows:
+        return []
+    columns = _column_names(cursor)
+    return [dict(zip(columns, row)) for row in rows]
+
+
+@functools.lru_cache(maxsize=128)
+def _table_sql(template: str, table_name: str) -> sql.Composed:
+    """Compose a statement with {table} bound to a quoted identifier (cached per table)"""
+    return sql.SQL(template).format(table=sql.Identifier(table_name))
+
+
+@functools.lru_cache(maxsize=128)
+def _copy_sql(table_name: str, columns: Tuple[str, ...]) -> sql.Composed:
+    """Compose the COPY ... FROM STDIN statement used by bulk_copy (cached per shape)"""
+    return sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+        sql.Identifier(table_name),
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+    )
+
+
+def _copy_value(value: Any) -> str:
+    """
+    Render one Python value as a COPY CSV field
+
+    In CSV format COPY reads an unquoted empty field as NULL and a quoted
+    one as a string, so every non-null value is quoted: no string (not even
+    '' or "\\N") can be mistaken for NULL.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        items = (
+            "NULL" if item is None
+            else '"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+            for item in value
+        )
+        text = "{" + ",".join(items) + "}"
+    elif isinstance(value, dict):
+        text = json.dumps(value)
+    else:
+        text = str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
 # ============================================================================
 # POSTGRESQL DATABASE MANAGER
 # ============================================================================
@@ -38,7 +262,7 @@ class PostgreSQLManager:
     Manages PostgreSQL database operations
 
     Handles:
-    - Connection management with context managers
+    - Connection pooling (thread-safe) with context managers
     - Query execution with error handling
     - Batch operations
     - Table existence checks
@@ -57,6 +281,8 @@ class PostgreSQLManager:
         """
         self.config = config or get_config()
         self.conn = None
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self.prepared_statements = self.config.get_db_prepared_statements()
         self._verify_connection()
 
     def _get_connection_string(self) -> str:
@@ -73,47 +299,65 @@ class PostgreSQLManager:
             return raw_url
 
     def _verify_connection(self) -> None:
-        """Verify database connection is available"""
+        """Open the connection pool, verifying the database is reachable"""
         try:
-            conn = psycopg2.connect(self._get_connection_string(), sslmode='require')
-            conn.close()
+            dsn = self._get_connection_string()
+            self._pool = ThreadedConnectionPool(
+                self.config.get_db_pool_min(),
+                self.config.get_db_pool_max(),
+                dsn,
+                **_connect_kwargs(dsn),
+            )
+            # minconn may be 0, so check out one connection explicitly
+            conn = self._pool.getconn()
+            self._pool.putconn(conn)
             logger.info("✓ PostgreSQL connection verified")
         except psycopg2.Error as e:
-            logger.error(f"✗ PostgreSQL connection failed: {e}")
+            logger.error("✗ PostgreSQL connection failed: %s", e)
             raise PostgreSQLConnectionError(f"Failed to connect to PostgreSQL: {e}") from e
 
     @contextmanager
     def get_connection(self):
         """
-        Context manager for database connections
+        Context manager for pooled database connections
+
+        The connection goes back to the pool on exit; an open transaction is
+        rolled back first and a broken connection is discarded.
 
         Yields:
             psycopg2 connection object
 
         Usage:
             with db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = conn.shared_cursor()
                 cursor.execute("SELECT * FROM table")
         """
-        conn = None
         try:
-            conn = psycopg2.connect(self._get_connection_string(), sslmode='require')
+            conn = self._pool.getconn()
+        except psycopg2.Error as e:
+            logger.error("Database connection error: %s", e)
+            raise PostgreSQLConnectionError(f"Database connection error: {e}") from e
+
+        try:
             yield conn
         except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             raise PostgreSQLConnectionError(f"Database connection error: {e}") from e
         finally:
-            if conn:
-                conn.close()
+            broken = bool(conn.closed)
+            if not broken and conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+            self._pool.putconn(conn, close=broken)
 
-    def execute(self, query: str, params: Tuple = None, fetch: bool = False) -> Any:
+    def execute(self, query: Union[str, sql.Composable], params: Tuple = None, fetch: bool = False) -> Any:
         """
         Execute a single SQL query
 
         Args:
-            query: SQL query string
+            query: SQL query string or psycopg2.sql composition
             params: Query parameters (for parameterized queries)
             fetch: If True, fetch and return results; if False, return row count
 
@@ -125,62 +369,108 @@ class PostgreSQLManager:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-                try:
-                    if params:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query)
-
-                    if fetch:
-                        result = cursor.fetchall()
-                        conn.commit()
-                        return result
-                    else:
-                        conn.commit()
-                        return cursor.rowcount
-                finally:
-                    cursor.close()
+                cursor = conn.shared_cursor()
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                if fetch:
+                    result = _fetch_dicts(cursor)
+                    conn.commit()
+                    return result
+                else:
+                    conn.commit()
+                    return cursor.rowcount
         except psycopg2.Error as e:
-            logger.error(f"SQL error: {e}\nQuery: {query}")
+            logger.error("SQL error: %s\nQuery: %s", e, query)
             raise DatabaseQueryError(f"SQL query failed: {e}") from e
 
-    def execute_many(self, query: str, data: List[Tuple]) -> int:
+    def execute_many(self, query: str, data: List[Tuple], page_size: Optional[int] = None) -> int:
         """
         Execute multiple insert/update statements (batch operation)
 
+        INSERT ... VALUES %s queries go through execute_values (many rows per
+        statement); any other statement with per-row %s placeholders goes
+        through execute_batch (many statements per round-trip).
+
         Args:
-            query: SQL query with %s placeholders
+            query: SQL query, either "INSERT ... VALUES %s" or with per-row %s placeholders
             data: List of tuples containing query parameters
+            page_size: Rows per server round-trip (default: 500 for VALUES, 100 otherwise)
 
         Returns:
-            Number of rows affected
+            Number of rows submitted (psycopg2 only reports the last page's rowcount)
 
         Raises:
             DatabaseInsertError: If batch insert fails
         """
+        if not data:
+            return 0
+
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                try:
-                    execute_values(cursor, query, data)
-                    conn.commit()
-                    rows_affected = cursor.rowcount
-                    logger.info(f"✓ Inserted {rows_affected} rows")
-                    return rows_affected
-                finally:
-                    cursor.close()
+                cursor = conn.shared_cursor()
+                if _VALUES_PLACEHOLDER.search(query):
+                    execute_values(cursor, query, data, page_size=page_size or 500)
+                else:
+                    execute_batch(cursor, query, data, page_size=page_size or 100)
+                conn.commit()
+                rows_affected = len(data)
+                logger.info("✓ Inserted %s rows", rows_affected)
+                return rows_affected
         except psycopg2.Error as e:
-            logger.error(f"Batch insert error: {e}")
+            logger.error("Batch insert error: %s", e)
             raise DatabaseInsertError(f"Batch insert failed: {e}") from e
 
-    def fetch_one(self, query: str, params: Tuple = None) -> Optional[Dict]:
+    def bulk_copy(self, table_name: str, columns: List[str], rows: List[Tuple]) -> int:
+        """
+        Bulk-load rows with COPY ... FROM STDIN (CSV), bypassing per-row Parse/Bind
+
+        Much faster than execute_many for large batches. None becomes NULL,
+        lists become PostgreSQL array literals and dicts become JSON.
+
+        Args:
+            table_name: Target table
+            columns: Column names, in the order of each row tuple
+            rows: Row tuples to load
+
+        Returns:
+            Number of rows loaded
+
+        Raises:
+            DatabaseInsertError: If the COPY fails
+        """
+        if not rows:
+            return 0
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join([_copy_value(value) for value in row]))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        statement = _copy_sql(table_name, tuple(columns))
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.shared_cursor()
+                cursor.copy_expert(statement, buffer)
+                conn.commit()
+                logger.info("✓ Copied %s rows into %s", len(rows), table_name)
+                return len(rows)
+        except psycopg2.Error as e:
+            logger.error("Bulk copy error: %s", e)
+            raise DatabaseInsertError(f"Bulk copy failed: {e}") from e
+
+    def fetch_one(self, query: str, params: Tuple = None, prepared: bool = False) -> Optional[Dict]:
         """
         Fetch a single row
 
         Args:
             query: SQL query string
             params: Query parameters
+            prepared: Run as a per-connection prepared statement (for hot, fixed
+                      queries); ignored when DB_PREPARED_STATEMENTS is off
 
         Returns:
             Single row as dictionary, or None if no results
@@ -190,28 +480,54 @@ class PostgreSQLManager:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-                try:
-                    if params:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query)
-                    result = cursor.fetchone()
-                    conn.commit()
-                    return result
-                finally:
-                    cursor.close()
+                cursor = conn.shared_cursor()
+                if prepared and self.prepared_statements:
+                    conn.execute_prepared(cursor, query, params)
+                elif params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                row = cursor.fetchone()
+                conn.commit()
+                return dict(zip(_column_names(cursor), row)) if row is not None else None
+        except psycopg2.Error as e:
+            logger.error("SQL error: %s", e)
+            raise DatabaseQueryError(f"SQL query failed: {e}") from e
+
+    def execute_scalar(self, query: str, params: Tuple = None) -> Any:
+        """
+        Fetch the first column of the first row (no row dict is built)
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+
+        Returns:
+            The value, or None if the query returned no rows
+
+        Raises:
+            DatabaseQueryError: If query fails
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.shared_cursor()
+                cursor.execute(query, params)
+                row = cursor.fetchone()
+                conn.commit()
+                return row[0] if row is not None else None
         except psycopg2.Error as e:
-            logger.error(f"SQL error: {e}")
+            logger.error("SQL error: %s", e)
             raise DatabaseQueryError(f"SQL query failed: {e}") from e
 
-    def fetch_all(self, query: str, params: Tuple = None) -> List[Dict]:
+    def fetch_all(self, query: str, params: Tuple = None, prepared: bool = False) -> List[Dict]:
         """
         Fetch all rows matching query
 
         Args:
             query: SQL query string
             params: Query parameters
+            prepared: Run as a per-connection prepared statement (for hot, fixed
+                      queries); ignored when DB_PREPARED_STATEMENTS is off
 
         Returns:
             List of rows as dictionaries
@@ -221,19 +537,56 @@ class PostgreSQLManager:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
+                cursor = conn.shared_cursor()
+                if prepared and self.prepared_statements:
+                    conn.execute_prepared(cursor, query, params)
+                elif params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                result = _fetch_dicts(cursor)
+                conn.commit()
+                return result
+        except psycopg2.Error as e:
+            logger.error("SQL error: %s", e)
+            raise DatabaseQueryError(f"SQL query failed: {e}") from e
+
+    def iter_rows(self, query: str, params: Tuple = None, itersize: int = 1000) -> Iterator[Dict]:
+        """
+        Stream rows through a named server-side cursor
+
+        Rows are fetched from the server itersize at a time, so memory stays
+        bounded for large results; the connection is held until the
+        generator is exhausted or closed.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+            itersize: Rows fetched per server round-trip
+
+        Yields:
+            Rows as dictionaries
+
+        Raises:
+            DatabaseQueryError: If query fails
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor(name=f"stream_{uuid.uuid4().hex}")
+                cursor.itersize = itersize
                 try:
-                    if params:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query)
-                    result = cursor.fetchall()
-                    conn.commit()
-                    return result if result else []
+                    cursor.execute(query, params)
+                    columns = None
+                    for row in cursor:
+                        if columns is None:
+                            # a named cursor has no description until the first fetch
+                            columns = _column_names(cursor)
+                        yield dict(zip(columns, row))
                 finally:
                     cursor.close()
+                conn.commit()
         except psycopg2.Error as e:
-            logger.error(f"SQL error: {e}")
+            logger.error("SQL error: %s", e)
             raise DatabaseQueryError(f"SQL query failed: {e}") from e
 
     def table_exists(self, table_name: str) -> bool:
@@ -259,7 +612,7 @@ class PostgreSQLManager:
             )
             return result[0]['exists'] if result else False
         except Exception as e:
-            logger.warning(f"Could not check if table {table_name} exists: {e}")
+            logger.warning("Could not check if table %s exists: %s", table_name, e)
             return False
 
     def view_exists(self, view_name: str) -> bool:
@@ -285,7 +638,7 @@ class PostgreSQLManager:
             )
             return result[0]['exists'] if result else False
         except Exception as e:
-            logger.warning(f"Could not check if view {view_name} exists: {e}")
+            logger.warning("Could not check if view %s exists: %s", view_name, e)
             return False
 
     def clear_table(self, table_name: str) -> int:
@@ -302,11 +655,11 @@ class PostgreSQLManager:
             DatabaseOperationError: If delete fails
         """
         try:
-            rows_deleted = self.execute(f"DELETE FROM {table_name}", fetch=False)
-            logger.info(f"✓ Cleared {rows_deleted} rows from {table_name}")
+            rows_deleted = self.execute(_table_sql("DELETE FROM {table}", table_name), fetch=False)
+            logger.info("✓ Cleared %s rows from %s", rows_deleted, table_name)
             return rows_deleted
         except Exception as e:
-            logger.error(f"Failed to clear table {table_name}: {e}")
+            logger.error("Failed to clear table %s: %s", table_name, e)
             raise DatabaseOperationError(f"Failed to clear table: {e}") from e
 
     def drop_table(self, table_name: str, cascade: bool = False) -> bool:
@@ -324,12 +677,12 @@ class PostgreSQLManager:
             DatabaseTableError: If drop fails
         """
         try:
-            cascade_clause = "CASCADE" if cascade else "RESTRICT"
-            self.execute(f"DROP TABLE IF EXISTS {table_name} {cascade_clause}", fetch=False)
-            logger.info(f"✓ Dropped table {table_name}")
+            template = "DROP TABLE IF EXISTS {table} CASCADE" if cascade else "DROP TABLE IF EXISTS {table} RESTRICT"
+            self.execute(_table_sql(template, table_name), fetch=False)
+            logger.info("✓ Dropped table %s", table_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to drop table {table_name}: {e}")
+            logger.error("Failed to drop table %s: %s", table_name, e)
             raise DatabaseTableError(f"Failed to drop table: {e}") from e
 
     def clear_all_cv_data(self, cv_id: Optional[str] = None) -> int:
@@ -367,31 +720,56 @@ class PostgreSQLManager:
                     if cv_id:
                         # Clear only records for this CV
                         if table_name == "cv_metadata":
-                            row_count = self.execute(f"DELETE FROM {table_name} WHERE id = %s", (cv_id,))
+                            row_count = self.execute(_table_sql("DELETE FROM {table} WHERE id = %s", table_name), (cv_id,))
                         else:
-                            row_count = self.execute(f"DELETE FROM {table_name} WHERE cv_id = %s", (cv_id,))
+                            row_count = self.execute(_table_sql("DELETE FROM {table} WHERE cv_id = %s", table_name), (cv_id,))
                         if row_count > 0:
-                            logger.info(f"✓ Cleared {row_count} rows from {table_name} for CV {cv_id[:8]}...")
+                            logger.info("✓ Cleared %s rows from %s for CV %s...", row_count, table_name, cv_id[:8])
                             total_cleared += row_count
                     else:
                         # Clear all records
                         row_count = self.clear_table(table_name)
                         total_cleared += row_count
                 except Exception as e:
-                    logger.warning(f"⚠ Could not clear {table_name}: {e}")
+                    logger.warning("⚠ Could not clear %s: %s", table_name, e)
             else:
-                logger.info(f"⚠ Table {table_name} does not exist (skipping)")
+                logger.info("⚠ Table %s does not exist (skipping)", table_name)
 
-        logger.info(f"\n✓ Total rows cleared: {total_cleared}")
+        logger.info("\n✓ Total rows cleared: %s", total_cleared)
         return total_cleared
 
-    def close(self) -> None:
+    def create_search_indexes(self) -> int:
         """
-        Close database connection
-        Note: Since we use context managers, this is mostly for compatibility
+        Create the indexes used by the MCP tool lookups (idempotent)
+
+        Runs from DatabaseTools.warmup() at worker start (a no-op once the
+        indexes exist); needs privileges to create the pg_trgm extension.
+        Each statement is attempted independently and failures are logged,
+        not raised. If pg_trgm is unavailable the trigram indexes are skipped.
+
+        Returns:
+            Number of statements that succeeded
         """
-        # Our implementation uses context managers that auto-close connections
-        logger.info("✓ Database connection manager ready for cleanup")
+        succeeded = 0
+        trigrams = True
+        for statement in _SEARCH_INDEXES:
+            if not trigrams and "gin_trgm_ops" in statement:
+                continue
+            try:
+                self.execute(statement)
+                succeeded += 1
+            except Exception as e:
+                logger.warning("⚠ Could not run '%s': %s", statement, e)
+                if "pg_trgm" in statement:
+                    trigrams = False
+        logger.info("✓ Search indexes ready (%s/%s statements)", succeeded, len(_SEARCH_INDEXES))
+        return succeeded
+
+    def close(self) -> None:
+        """Close every pooled database connection"""
+        if self._pool is not None and not self._pool.closed:
+            self._pool.closeall()
+        logger.info("✓ PostgreSQL connection pool closed")
 
 
 # ============================================================================
@@ -409,6 +787,9 @@ class QdrantManager:
     - Point insertion and deletion
     """
 
+    # Payload fields filtered on by searches (see mcp_server.DatabaseTools)
+    KEYWORD_INDEX_FIELDS = ("section", "cv_id")
+
     def __init__(self, config: Optional[ConfigManager] = None):
         """
         Initialize Qdrant manager
@@ -434,9 +815,9 @@ class QdrantManager:
             )
             # Verify connection by checking health
             self.client.get_collections()
-            logger.info(f"✓ Connected to Qdrant at {self.config.get_qdrant_url()}")
+            logger.info("✓ Connected to Qdrant at %s", self.config.get_qdrant_url())
         except Exception as e:
-            logger.error(f"✗ Qdrant connection failed: {e}")
+            logger.error("✗ Qdrant connection failed: %s", e)
             raise QdrantConnectionError(f"Failed to connect to Qdrant: {e}") from e
 
     def collection_exists(self, collection_name: str) -> bool:
@@ -454,7 +835,7 @@ class QdrantManager:
             collection_names = [col.name for col in collections]
             return collection_name in collection_names
         except Exception as e:
-            logger.error(f"Error checking collection existence: {e}")
+            logger.error("Error checking collection existence: %s", e)
             return False
 
     def create_collection(self, collection_name: str, vector_size: int = 1536,
@@ -475,7 +856,7 @@ class QdrantManager:
         """
         try:
             if self.collection_exists(collection_name):
-                logger.info(f"Collection '{collection_name}' already exists")
+                logger.info("Collection '%s' already exists", collection_name)
                 return True
 
             distance = {
@@ -490,10 +871,10 @@ class QdrantManager:
                 vectors_config=VectorParams(size=vector_size, distance=distance)
             )
 
-            logger.info(f"✓ Created collection '{collection_name}' ({vector_size}D, {distance_metric})")
+            logger.info("✓ Created collection '%s' (%sD, %s)", collection_name, vector_size, distance_metric)
             return True
         except Exception as e:
-            logger.error(f"Failed to create collection: {e}")
+            logger.error("Failed to create collection: %s", e)
             raise QdrantConnectionError(f"Failed to create collection: {e}") from e
 
     def delete_collection(self, collection_name: str) -> bool:
@@ -511,14 +892,14 @@ class QdrantManager:
         """
         try:
             if not self.collection_exists(collection_name):
-                logger.info(f"Collection '{collection_name}' does not exist")
+                logger.info("Collection '%s' does not exist", collection_name)
                 return True
 
             self.client.delete_collection(collection_name=collection_name)
-            logger.info(f"✓ Deleted collection '{collection_name}'")
+            logger.info("✓ Deleted collection '%s'", collection_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete collection: {e}")
+            logger.error("Failed to delete collection: %s", e)
             raise QdrantConnectionError(f"Failed to delete collection: {e}") from e
 
     def insert_points(self, collection_name: str, points: List[PointStruct]) -> bool:
@@ -540,10 +921,10 @@ class QdrantManager:
                 collection_name=collection_name,
                 points=points
             )
-            logger.info(f"✓ Inserted {len(points)} points into '{collection_name}'")
+            logger.info("✓ Inserted %s points into '%s'", len(points), collection_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to insert points: {e}")
+            logger.error("Failed to insert points: %s", e)
             raise DatabaseInsertError(f"Failed to insert vectors: {e}") from e
 
     def search(self, collection_name: str, query_vector: List[float],
@@ -566,13 +947,14 @@ class QdrantManager:
             DatabaseQueryError: If search fails
         """
         try:
-            results = self.client.search(
+            results = self.client.query_points(
                 collection_name=collection_name,
-                query_vector=query_vector,
+                query=query_vector,
                 limit=limit,
                 score_threshold=score_threshold,
-                query_filter=query_filter
-            )
+                query_filter=query_filter,
+                with_payload=True
+            ).points
 
             # Convert results to dictionary format
             formatted_results = [
@@ -584,10 +966,10 @@ class QdrantManager:
                 for result in results
             ]
 
-            logger.info(f"Search returned {len(formatted_results)} results from '{collection_name}'")
+            logger.info("Search returned %s results from '%s'", len(formatted_results), collection_name)
             return formatted_results
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             raise DatabaseQueryError(f"Vector search failed: {e}") from e
 
     def get_point(self, collection_name: str, point_id: int) -> Optional[Dict[str, Any]]:
@@ -617,7 +999,7 @@ class QdrantManager:
                 }
             return None
         except Exception as e:
-            logger.error(f"Failed to retrieve point: {e}")
+            logger.error("Failed to retrieve point: %s", e)
             raise DatabaseQueryError(f"Failed to retrieve point: {e}") from e
 
     def delete_points(self, collection_name: str, point_ids: List[int]) -> bool:
@@ -639,10 +1021,10 @@ class QdrantManager:
                 collection_name=collection_name,
                 points_selector=point_ids
             )
-            logger.info(f"✓ Deleted {len(point_ids)} points from '{collection_name}'")
+            logger.info("✓ Deleted %s points from '%s'", len(point_ids), collection_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete points: {e}")
+            logger.error("Failed to delete points: %s", e)
             raise DatabaseOperationError(f"Failed to delete vectors: {e}") from e
 
     def get_collection_stats(self, collection_name: str) -> Dict[str, Any]:
@@ -667,7 +1049,7 @@ class QdrantManager:
                 "distance_metric": str(collection_info.config.params.vectors.distance) if collection_info.config.params.vectors else None,
             }
         except Exception as e:
-            logger.error(f"Failed to get collection stats: {e}")
+            logger.error("Failed to get collection stats: %s", e)
             raise DatabaseQueryError(f"Failed to get collection stats: {e}") from e
 
     def check_collection_exists(self, collection_name: str) -> bool:
@@ -702,22 +1084,59 @@ class QdrantManager:
         """
         Create payload indexes for efficient filtering on key fields
 
+        Keyword indexes on the filtered fields let Qdrant apply filters during
+        HNSW traversal instead of checking payloads per candidate. Only missing
+        indexes are created, so this is safe to call on every startup.
+        Payload indexes are optional - failures are logged, not raised.
+
         Args:
             collection_name: Name of the collection
         """
-        # Payload indexes are optional - log info but don't fail
-        logger.info(f"✓ Payload indexes for '{collection_name}' are handled by Qdrant automatically")
+        try:
+            existing = self.client.get_collection(collection_name).payload_schema or {}
+        except Exception as e:
+            logger.warning("Could not read payload indexes for '%s': %s", collection_name, e)
+            return
+
+        for field_name in self.KEYWORD_INDEX_FIELDS:
+            if field_name in existing:
+                continue
+            try:
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType.KEYWORD,
+                )
+                logger.info("✓ Created payload index '%s' on '%s'", field_name, collection_name)
+            except Exception as e:
+                logger.warning("Could not create payload index '%s' on '%s': %s", field_name, collection_name, e)
 
 
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
+# One manager (and so one connection pool / client) per class and config;
+# the lock keeps concurrent first calls from opening two pools
+_managers: Dict[Tuple[type, Optional[ConfigManager]], Any] = {}
+_managers_lock = threading.Lock()
+
+
+def _shared_manager(manager_class: type, config: Optional[ConfigManager]) -> Any:
+    """Return the process-wide manager for (manager_class, config), creating it once"""
+    key = (manager_class, config)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = manager_class(config)
+        return manager
+
+
 def get_postgres_manager(config: Optional[ConfigManager] = None) -> PostgreSQLManager:
     """Get or create PostgreSQL manager instance"""
-    return PostgreSQLManager(config)
+    return _shared_manager(PostgreSQLManager, config)
 
 
 def get_qdrant_manager(config: Optional[ConfigManager] = None) -> QdrantManager:
     """Get or create Qdrant manager instance"""
-    return QdrantManager(config)
\ No newline at end of file
+    return _shared_manager(QdrantManager, config)
\ No newline at end of file
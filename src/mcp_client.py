@@ -9,6 +9,7 @@ Refactored to use:
 """
 
 import logging
+import threading
 from typing import Dict, List, Any, Optional
 
 from config import get_config, ConfigManager
@@ -38,9 +39,9 @@ class MCPClient:
             # Initialize CV ID at startup (fetches it once and caches it)
             # This ensures we fail early if database is not configured properly
             self.cv_id = self.tools.get_cv_id()
-            logger.info(f"MCP Client initialized successfully with CV ID: {self.cv_id[:8]}...")
+            logger.info("MCP Client initialized successfully with CV ID: %s...", self.cv_id[:8])
         except Exception as e:
-            logger.error(f"Failed to initialize MCP Client: {e}")
+            logger.error("Failed to initialize MCP Client: %s", e)
             raise MCPServerError(f"MCP Client initialization failed: {str(e)}")
 
     # ========================================================================
@@ -102,10 +103,47 @@ class MCPClient:
     # ========================================================================
     # Tool 9: Semantic Search
     # ========================================================================
-    def semantic_search(self, query: str, section: Optional[str] = None, top_k: int = 5) -> Dict[str, Any]:
+    def semantic_search(self, query: str, section: Optional[str] = None, top_k: int = 5,
+                        query_vector: Optional[List[float]] = None) -> Dict[str, Any]:
         """Perform semantic search on CV content using vector embeddings"""
+        if query_vector is not None:
+            return self.tools.semantic_search(query, section, top_k, query_vector=query_vector)
         return self.tools.semantic_search(query, section, top_k)
 
+    def semantic_search_batch(self, queries: List[str], sections: Optional[List[Optional[str]]] = None,
+                              top_ks: Optional[List[int]] = None,
+                              query_vectors: Optional[List[Optional[List[float]]]] = None) -> List[Dict[str, Any]]:
+        """Run several semantic searches in one embedding call and one Qdrant request"""
+        return self.tools.semantic_search_batch(queries, sections, top_ks, query_vectors)
+
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a search query (used by the agent-side semantic cache)"""
+        return self.tools.embed_query(query)
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed several search queries with a single embedding API call"""
+        return self.tools.embed_queries(queries)
+
+    async def aembed_query(self, query: str) -> List[float]:
+        """Embed a search query without blocking a worker thread"""
+        return (await self.tools.aembed_queries([query]))[0]
+
+    async def aembed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed several search queries in one async embedding API call"""
+        return await self.tools.aembed_queries(queries)
+
+    def warmup(self) -> None:
+        """Open embedding API / Qdrant connections before the first tool call"""
+        self.tools.warmup()
+
+    async def awarmup(self) -> None:
+        """Open the async embedding API connection on the running event loop"""
+        await self.tools.awarmup()
+
+    def close(self) -> None:
+        """Close database / vector store clients (process shutdown)"""
+        self.tools.close()
+
     # ========================================================================
     # Tool 10: Get All Work Experience ⭐ PRIMARY FOR EXPERIENCE QUERIES
     # ========================================================================
@@ -310,13 +348,16 @@ class MCPClient:
 
 # Global client instance
 _client = None
+_client_lock = threading.Lock()
 
 
 def get_mcp_client() -> MCPClient:
-    """Get or create global MCP client instance"""
+    """Get or create global MCP client instance (thread-safe)"""
     global _client
     if _client is None:
-        _client = MCPClient()
+        with _client_lock:
+            if _client is None:
+                _client = MCPClient()
     return _client
 
 
@@ -8,13 +8,17 @@ Refactored to use:
 - Custom exceptions (exceptions.py) for better error handling
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
 
 from langchain_openai import OpenAIEmbeddings
-from qdrant_client.models import Filter, FieldCondition, MatchValue
+# QueryRequest/query_batch_points (and query_points) need qdrant-client>=1.10
+from qdrant_client.models import Filter, FieldCondition, MatchValue, QueryRequest, SearchParams
 
+from cache import EmbeddingCache
 from config import get_config, ConfigManager
 from db_manager import get_postgres_manager, get_qdrant_manager, PostgreSQLManager, QdrantManager
 from exceptions import (
@@ -29,6 +33,10 @@ from exceptions import (
 # Initialize logger (will be configured by config.configure_logging() at application startup)
 logger = logging.getLogger(__name__)
 
+# HNSW beam width for semantic search: bounded for the small top_k the tools
+# request (the collection default is ef_construct)
+SEMANTIC_SEARCH_PARAMS = SearchParams(hnsw_ef=64, exact=False)
+
 # ============================================================================
 # DIAGNOSTIC UTILITIES
 # ============================================================================
@@ -173,6 +181,16 @@ def diagnose_cv_availability() -> Dict[str, Any]:
 class DatabaseTools:
     """MCP Tools for accessing CV database"""
 
+    # Payload fields copied into semantic search hits, per Qdrant "section"
+    SEMANTIC_SECTION_FIELDS = MappingProxyType({
+        "work experience": ("company", "role", "domain", "responsibility"),
+        "education": ("institution", "degree", "thesis", "graduation_date"),
+        "publication": ("title",),
+        "projects": ("project_name", "responsibility", "technologies"),
+    })
+    # Copied for every section; description covers skills, awards and the rest
+    SEMANTIC_COMMON_FIELDS = ("technologies", "skills", "description")
+
     def __init__(self, config: Optional[ConfigManager] = None):
         """
         Initialize DatabaseTools with configuration.
@@ -191,21 +209,172 @@ class DatabaseTools:
             )
             logger.info("Embedding model initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize embedding model: {e}")
+            logger.error("Failed to initialize embedding model: %s", e)
             raise QdrantConnectionError(f"Failed to initialize embedding model: {e}")
 
-        self._cv_id: Optional[str] = None  # Cached CV ID
+        self.embedding_cache = EmbeddingCache(
+            self.config.get_embedding_cache_path(), model="text-embedding-3-small"
+        )
+
+        # Resolve the CV ID up front so the first tool call skips the lookup;
+        # if no CV is loaded yet, get_cv_id() retries lazily
+        self._cv_id: Optional[str] = None
+        try:
+            self._cv_id = self._load_cv_id()
+        except Exception as e:
+            logger.warning("CV ID not available at startup: %s", e)
         logger.info("DatabaseTools initialized with centralized managers")
 
+    def _load_cv_id(self) -> str:
+        """Read the CV ID from cv_metadata"""
+        cv_id = self.pg_manager.execute_scalar("SELECT id FROM cv_metadata LIMIT 1")
+        if cv_id is None:
+            raise CVNotFoundError("No CV data found in database. Please run db_ingestion.py to load data.")
+        return str(cv_id)
+
     def get_cv_id(self) -> str:
-        """Get CV ID from database (cached after first call)"""
+        """Get CV ID (loaded at startup, or from the database on first call)"""
         if self._cv_id is None:
-            result = self.pg_manager.fetch_one("SELECT id FROM cv_metadata LIMIT 1")
-            if not result:
-                raise CVNotFoundError("No CV data found in database. Please run db_ingestion.py to load data.")
-            self._cv_id = str(result['id'])
+            self._cv_id = self._load_cv_id()
         return self._cv_id
 
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query with the configured embedding model.
+
+        Args:
+            query: Natural language search query
+
+        Returns:
+            Query embedding vector
+        """
+        return self.embed_queries([query])[0]
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed several search queries, serving repeats from the embedding cache.
+
+        All cache misses are embedded with a single embedding API call.
+
+        Args:
+            queries: Natural language search queries
+
+        Returns:
+            Embedding vectors aligned with queries
+        """
+        embeddings, misses = self._cached_embeddings(queries)
+        if not misses:
+            return embeddings
+
+        if len(misses) == 1:
+            fresh = [self.embedding_model.embed_query(misses[0])]
+        else:
+            fresh = self.embedding_model.embed_documents(misses)
+        return self._merge_embeddings(queries, embeddings, misses, fresh)
+
+    async def aembed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Async variant of embed_queries for callers on the event loop.
+
+        Cache misses go to the embedding API over the model's async HTTP
+        client, so no worker thread is held while waiting on the network.
+        Only the in-memory LRU is read on the loop; sqlite reads and writes
+        (which can sit in sqlite's busy wait) run in a worker thread.
+
+        Args:
+            queries: Natural language search queries
+
+        Returns:
+            Embedding vectors aligned with queries
+        """
+        embeddings, misses = self._cached_embeddings(queries, memory_only=True)
+        if misses:
+            embeddings, misses = await asyncio.to_thread(self._cached_embeddings, queries)
+        if not misses:
+            return embeddings
+
+        if len(misses) == 1:
+            fresh = [await self.embedding_model.aembed_query(misses[0])]
+        else:
+            fresh = await self.embedding_model.aembed_documents(misses)
+        return await asyncio.to_thread(self._merge_embeddings, queries, embeddings, misses, fresh)
+
+    def _cached_embeddings(self, queries: List[str],
+                           memory_only: bool = False) -> Tuple[List[Optional[List[float]]], List[str]]:
+        """Look queries up in the embedding cache; returns (embeddings, unique misses)"""
+        embeddings = self.embedding_cache.get_many(queries, memory_only=memory_only)
+        misses = list(dict.fromkeys(q for q, vec in zip(queries, embeddings) if vec is None))
+        if not misses:
+            logger.debug("Embedding cache hit for %s quer(ies)", len(queries))
+        return embeddings, misses
+
+    def _merge_embeddings(self, queries: List[str], embeddings: List[Optional[List[float]]],
+                          misses: List[str], fresh: List[List[float]]) -> List[List[float]]:
+        """Store freshly computed embeddings and fill them into the cached lookup"""
+        self.embedding_cache.put_many(misses, fresh)
+        computed = dict(zip(misses, fresh))
+        return [vec if vec is not None else computed[q] for q, vec in zip(queries, embeddings)]
+
+    def warmup(self) -> None:
+        """
+        Open the connections used on the first tool call ahead of time.
+
+        Sends one uncached embedding request over the sync client (opens its
+        pooled HTTPS connection to the embedding API), touches the Qdrant
+        collection, creating its payload indexes if missing, and creates the
+        PostgreSQL search indexes if missing. The async client used by
+        aembed_queries is warmed separately by awarmup(). Failures are logged
+        only; the tools still connect lazily.
+        """
+        try:
+            self.embedding_model.embed_query("warmup")
+            logger.debug("Embedding client warmed up")
+        except Exception as e:
+            logger.warning("Embedding warmup failed: %s", e)
+
+        try:
+            # Reads the collection (warming the client) and adds any missing filter indexes
+            self.qdrant_manager.create_payload_indexes(self.config.get_qdrant_collection())
+            logger.debug("Qdrant client warmed up")
+        except Exception as e:
+            logger.warning("Qdrant warmup failed: %s", e)
+
+        try:
+            # Trigram indexes behind the ILIKE lookups
+            self.pg_manager.create_search_indexes()
+        except Exception as e:
+            logger.warning("PostgreSQL search index setup failed: %s", e)
+
+    async def awarmup(self) -> None:
+        """
+        Open the async embedding client's HTTPS connection ahead of time.
+
+        Its connections belong to the event loop that opens them, so this runs
+        on the job's loop (once per session) rather than in warmup(). Failures
+        are logged only.
+        """
+        try:
+            await self.embedding_model.aembed_query("warmup")
+            logger.debug("Async embedding client warmed up")
+        except Exception as e:
+            logger.warning("Async embedding warmup failed: %s", e)
+
+    def close(self) -> None:
+        """
+        Release database clients and the embedding cache on shutdown.
+
+        Each close is attempted independently; failures are logged only.
+        """
+        for label, close in (
+            ("PostgreSQL", self.pg_manager.close),
+            ("Qdrant", self.qdrant_manager.client.close),
+            ("Embedding cache", self.embedding_cache.close),
+        ):
+            try:
+                close()
+            except Exception as e:
+                logger.warning("%s close failed: %s", label, e)
+
     # ========================================================================
     # TOOL 1: Get CV Summary
     # ========================================================================
@@ -223,7 +392,7 @@ class DatabaseTools:
                        domains, all_skills
                 FROM cv_summary
                 LIMIT 1
-            """)
+            """, prepared=True)
 
             if result:
                 logger.info("CV summary retrieved successfully")
@@ -241,21 +410,21 @@ class DatabaseTools:
                 }
 
         except PostgreSQLConnectionError as e:
-            logger.error(f"Database connection error in get_cv_summary: {e}")
+            logger.error("Database connection error in get_cv_summary: %s", e)
             return {
                 "status": "error",
                 "tool": "get_cv_summary",
                 "error": f"Database connection failed: {str(e)}"
             }
         except DatabaseQueryError as e:
-            logger.error(f"Query error in get_cv_summary: {e}")
+            logger.error("Query error in get_cv_summary: %s", e)
             return {
                 "status": "error",
                 "tool": "get_cv_summary",
                 "error": f"Query failed: {str(e)}"
             }
         except Exception as e:
-            logger.error(f"Unexpected error in get_cv_summary: {e}")
+            logger.error("Unexpected error in get_cv_summary: %s", e)
             return {
                 "status": "error",
                 "tool": "get_cv_summary",
@@ -283,15 +452,9 @@ class DatabaseTools:
                 FROM work_experience
                 WHERE cv_id = %s AND company ILIKE %s
                 ORDER BY start_date DESC
-            """, (cv_id, f"%{company_name}%"))
-
-            # Convert dates to strings
-            for result in results:
-                for key in ["start_date", "end_date"]:
-                    if result.get(key):
-                        result[key] = str(result[key])
+            """, (cv_id, f"%{company_name}%"), prepared=True)
 
-            logger.info(f"Found {len(results)} jobs at {company_name}")
+            logger.info("Found %s jobs at %s", len(results), company_name)
             return {
                 "status": "success",
                 "tool": "search_company_experience",
@@ -301,14 +464,14 @@ class DatabaseTools:
             }
 
         except CVNotFoundError as e:
-            logger.error(f"CV not found in search_company_experience: {e}")
+            logger.error("CV not found in search_company_experience: %s", e)
             return {
                 "status": "error",
                 "tool": "search_company_experience",
                 "error": f"CV not found: {str(e)}"
             }
         except Exception as e:
-            logger.error(f"Error in search_company_experience: {e}")
+            logger.error("Error in search_company_experience: %s", e)
             return {
                 "status": "error",
                 "tool": "search_company_experience",
@@ -335,15 +498,9 @@ class DatabaseTools:
                 FROM work_experience
                 WHERE cv_id = %s AND %s = ANY(technologies)
                 ORDER BY start_date DESC
-            """, (cv_id, technology))
+            """, (cv_id, technology), prepared=True)
 
-            # Convert dates
-            for result in results:
-                for key in ["start_date", "end_date"]:
-                    if result.get(key):
-                        result[key] = str(result[key])
-
-            logger.info(f"Found {len(results)} jobs using {technology}")
+            logger.info("Found %s jobs using %s", len(results), technology)
             return {
                 "status": "success",
                 "tool": "search_technology_experience",
@@ -353,7 +510,7 @@ class DatabaseTools:
             }
 
         except Exception as e:
-            logger.error(f"Error in search_technology_experience: {e}")
+            logger.error("Error in search_technology_experience: %s", e)
             return {
                 "status": "error",
                 "tool": "search_technology_experience",
@@ -383,14 +540,9 @@ class DatabaseTools:
                   AND start_date >= %s::date
                   AND (end_date <= %s::date OR end_date IS NULL)
                 ORDER BY start_date DESC
-            """, (cv_id, f"{start_year}-01-01", f"{end_year}-12-31"))
-
-            for result in results:
-                for key in ["start_date", "end_date"]:
-                    if result.get(key):
-                        result[key] = str(result[key])
+            """, (cv_id, f"{start_year}-01-01", f"{end_year}-12-31"), prepared=True)
 
-            logger.info(f"Found {len(results)} jobs between {start_year}-{end_year}")
+            logger.info("Found %s jobs between %s-%s", len(results), start_year, end_year)
             return {
                 "status": "success",
                 "tool": "search_work_by_date",
@@ -400,7 +552,7 @@ class DatabaseTools:
             }
 
         except Exception as e:
-            logger.error(f"Error in search_work_by_date: {e}")
+            logger.error("Error in search_work_by_date: %s", e)
             return {
                 "status": "error",
                 "tool": "search_work_by_date",
@@ -429,7 +581,7 @@ class DatabaseTools:
                     SELECT institution, degree, field, specialization, graduation_date, thesis, publications, content
                     FROM education
                     WHERE cv_id = %s AND institution ILIKE %s
-                """, (cv_id, f"%{institution}%"))
+                """, (cv_id, f"%{institution}%"), prepared=True)
                 search_type = f"institution: {institution}"
 
             elif degree:
@@ -437,7 +589,7 @@ class DatabaseTools:
                     SELECT institution, degree, field, specialization, graduation_date, thesis, content
                     FROM education
                     WHERE cv_id = %s AND degree ILIKE %s
-                """, (cv_id, f"%{degree}%"))
+                """, (cv_id, f"%{degree}%"), prepared=True)
                 search_type = f"degree: {degree}"
 
             else:
@@ -445,14 +597,10 @@ class DatabaseTools:
                     SELECT institution, degree, field, specialization, graduation_date, thesis, content
                     FROM education
                     WHERE cv_id = %s
-                """, (cv_id,))
+                """, (cv_id,), prepared=True)
                 search_type = "all education"
 
-            for result in results:
-                if result.get("graduation_date"):
-                    result["graduation_date"] = str(result["graduation_date"])
-
-            logger.info(f"Found {len(results)} education records for {search_type}")
+            logger.info("Found %s education records for %s", len(results), search_type)
             return {
                 "status": "success",
                 "tool": "search_education",
@@ -462,7 +610,7 @@ class DatabaseTools:
             }
 
         except Exception as e:
-            logger.error(f"Error in search_education: {e}")
+            logger.error("Error in search_education: %s", e)
             return {
                 "status": "error",
                 "tool": "search_education",
@@ -491,7 +639,7 @@ class DatabaseTools:
                     FROM publications
                     WHERE cv_id = %s AND year = %s
                     ORDER BY year DESC
-                """, (cv_id, year))
+                """, (cv_id, year), prepared=True)
                 search_type = f"year: {year}"
 
             else:
@@ -500,10 +648,10 @@ class DatabaseTools:
                     FROM publications
                     WHERE cv_id = %s
                     ORDER BY year DESC
-                """, (cv_id,))
+                """, (cv_id,), prepared=True)
                 search_type = "all publications"
 
-            logger.info(f"Found {len(results)} publications for {search_type}")
+            logger.info("Found %s publications for %s", len(results), search_type)
             return {
                 "status": "success",
                 "tool": "search_publications",
@@ -513,7 +661,7 @@ class DatabaseTools:
             }
 
         except Exception as e:
-            logger.error(f"Error in search_publications: {e}")
+            logger.error("Error in search_publications: %s", e)
             return {
                 "status": "error",
                 "tool": "search_publications",
@@ -540,9 +688,9 @@ class DatabaseTools:
                 FROM skills
                 WHERE cv_id = %s AND skill_category = %s
                 ORDER BY skill_name
-            """, (cv_id, category))
+            """, (cv_id, category), prepared=True)
 
-            logger.info(f"Found {len(results)} skills in category {category}")
+            logger.info("Found %s skills in category %s", len(results), category)
             return {
                 "status": "success",
                 "tool": "search_skills",
@@ -552,7 +700,7 @@ class DatabaseTools:
             }
 
         except Exception as e:
-            logger.error(f"Error in search_skills: {e}")
+            logger.error("Error in search_skills: %s", e)
             return {
                 "status": "error",
                 "tool": "search_skills",
@@ -581,7 +729,7 @@ class DatabaseTools:
                     FROM awards_certifications
                     WHERE cv_id = %s AND (issuing_organization ILIKE %s OR organization ILIKE %s OR title ILIKE %s)
                     ORDER BY issue_date DESC
-                """, (cv_id, f"%{award_type}%", f"%{award_type}%", f"%{award_type}%"))
+                """, (cv_id, f"%{award_type}%", f"%{award_type}%", f"%{award_type}%"), prepared=True)
                 search_type = f"type: {award_type}"
 
             else:
@@ -590,14 +738,10 @@ class DatabaseTools:
                     FROM awards_certifications
                     WHERE cv_id = %s
                     ORDER BY issue_date DESC
-                """, (cv_id,))
+                """, (cv_id,), prepared=True)
                 search_type = "all awards and certifications"
 
-            for result in results:
-                if result.get("issue_date"):
-                    result["issue_date"] = str(result["issue_date"])
-
-            logger.info(f"Found {len(results)} awards/certifications for {search_type}")
+            logger.info("Found %s awards/certifications for %s", len(results), search_type)
             return {
                 "status": "success",
                 "tool": "search_awards_certifications",
@@ -607,7 +751,7 @@ class DatabaseTools:
             }
 
         except Exception as e:
-            logger.error(f"Error in search_awards_certifications: {e}")
+            logger.error("Error in search_awards_certifications: %s", e)
             return {
                 "status": "error",
                 "tool": "search_awards_certifications",
@@ -617,7 +761,8 @@ class DatabaseTools:
     # ========================================================================
     # TOOL 9: Semantic Search
     # ========================================================================
-    def semantic_search(self, query: str, section: Optional[str] = None, top_k: int = 5) -> Dict[str, Any]:
+    def semantic_search(self, query: str, section: Optional[str] = None, top_k: int = 5,
+                        query_vector: Optional[List[float]] = None) -> Dict[str, Any]:
         """
         Perform semantic search on CV content using vector embeddings.
 
@@ -625,116 +770,127 @@ class DatabaseTools:
             query: Natural language search query
             section: Filter by section (work_experience, education, publication, all)
             top_k: Number of results to return (default: 5)
+            query_vector: Precomputed query embedding (optional, skips re-embedding)
 
         Returns:
             Dict with semantic search results from Qdrant
         """
         try:
-            query_embedding = self.embedding_model.embed_query(query)
+            query_embedding = query_vector if query_vector is not None else self.embed_query(query)
+
+            results = self.qdrant_manager.client.query_points(
+                collection_name=self.config.get_qdrant_collection(),
+                query=query_embedding,
+                query_filter=self._section_filter(section),
+                limit=top_k,
+                with_payload=True,
+                search_params=SEMANTIC_SEARCH_PARAMS
+            ).points
+            return self._semantic_search_response(query, section, results)
 
-            search_params = {
-                "collection_name": self.config.get_qdrant_collection(),
-                "query_vector": query_embedding,
-                "limit": top_k
+        except Exception as e:
+            logger.error("Error in semantic_search: %s", e)
+            return {
+                "status": "error",
+                "tool": "semantic_search",
+                "error": str(e)
             }
 
-            # Add section filter if provided
-            if section and section != "all":
-                
-                search_params["query_filter"] = Filter(
-                    must=[
-                        FieldCondition(
-                            key="section",
-                            match=MatchValue(value=section)
-                        )
-                    ]
-                )
+    def semantic_search_batch(self, queries: List[str], sections: Optional[List[Optional[str]]] = None,
+                              top_ks: Optional[List[int]] = None,
+                              query_vectors: Optional[List[Optional[List[float]]]] = None) -> List[Dict[str, Any]]:
+        """
+        Run several semantic searches with one embedding call and one Qdrant request.
 
-            results = self.qdrant_manager.client.search(**search_params)
+        Args:
+            queries: Natural language search queries
+            sections: Section filter per query (default: no filter)
+            top_ks: Number of results per query (default: 5)
+            query_vectors: Precomputed embedding per query; None entries are embedded
 
-            formatted_results = []
-            for result in results:
-                # Build result with core fields
-                formatted_result = {
-                    "chunk_id": result.payload.get("chunk_id"),
-                    "cv_id": result.payload.get("cv_id"),
-                    "section": result.payload.get("section"),
-                    "similarity_score": result.score
-                }
+        Returns:
+            List of semantic_search result dicts aligned with queries
+        """
+        count = len(queries)
+        sections = sections or [None] * count
+        top_ks = top_ks or [5] * count
+        query_vectors = query_vectors or [None] * count
 
-                # Add section-specific metadata fields
-                section_value = result.payload.get("section", "")
-
-                # Work experience specific fields
-                if section_value == "work experience":
-                    if result.payload.get("company"):
-                        formatted_result["company"] = result.payload.get("company")
-                    if result.payload.get("role"):
-                        formatted_result["role"] = result.payload.get("role")
-                    if result.payload.get("domain"):
-                        formatted_result["domain"] = result.payload.get("domain")
-                    if result.payload.get("responsibility"):
-                        formatted_result["responsibility"] = result.payload.get("responsibility")
-
-                # Education specific fields
-                elif section_value == "education":
-                    if result.payload.get("institution"):
-                        formatted_result["institution"] = result.payload.get("institution")
-                    if result.payload.get("degree"):
-                        formatted_result["degree"] = result.payload.get("degree")
-                    if result.payload.get("thesis"):
-                        formatted_result["thesis"] = result.payload.get("thesis")
-                    if result.payload.get("graduation_date"):
-                        formatted_result["graduation_date"] = result.payload.get("graduation_date")
-                    if result.payload.get("description"):
-                        formatted_result["description"] = result.payload.get("description")
-
-                # Publication specific fields
-                elif section_value == "publication":
-                    if result.payload.get("title"):
-                        formatted_result["title"] = result.payload.get("title")
-                    if result.payload.get("description"):
-                        formatted_result["description"] = result.payload.get("description")
-
-                # Projects specific fields
-                elif section_value == "projects":
-                    if result.payload.get("project_name"):
-                        formatted_result["project_name"] = result.payload.get("project_name")
-                    if result.payload.get("responsibility"):
-                        formatted_result["responsibility"] = result.payload.get("responsibility")
-                    if result.payload.get("technologies"):
-                        formatted_result["technologies"] = result.payload.get("technologies")
-                    if result.payload.get("description"):
-                        formatted_result["description"] = result.payload.get("description")
-
-                # Common optional fields
-                if result.payload.get("technologies"):
-                    formatted_result["technologies"] = result.payload.get("technologies")
-                if result.payload.get("skills"):
-                    formatted_result["skills"] = result.payload.get("skills")
-                # Catch-all: surface description for skills, awards, and any other section
-                if result.payload.get("description") and "description" not in formatted_result:
-                    formatted_result["description"] = result.payload.get("description")
-
-                formatted_results.append(formatted_result)
-
-            logger.info(f"Semantic search found {len(formatted_results)} results for query: '{query}'")
-            return {
-                "status": "success",
-                "tool": "semantic_search",
-                "query": query,
-                "section_filter": section or "all",
-                "results_count": len(formatted_results),
-                "results": formatted_results
-            }
+        try:
+            missing = [q for q, vec in zip(queries, query_vectors) if vec is None]
+            embedded = iter(self.embed_queries(missing) if missing else [])
+            vectors = [vec if vec is not None else next(embedded) for vec in query_vectors]
+
+            requests = [
+                QueryRequest(query=vector, filter=self._section_filter(section),
+                             limit=top_k, with_payload=True, params=SEMANTIC_SEARCH_PARAMS)
+                for vector, section, top_k in zip(vectors, sections, top_ks)
+            ]
+            responses = self.qdrant_manager.client.query_batch_points(
+                collection_name=self.config.get_qdrant_collection(),
+                requests=requests
+            )
+            return [
+                self._semantic_search_response(query, section, response.points)
+                for query, section, response in zip(queries, sections, responses)
+            ]
 
         except Exception as e:
-            logger.error(f"Error in semantic_search: {e}")
-            return {
-                "status": "error",
-                "tool": "semantic_search",
-                "error": str(e)
-            }
+            logger.error("Error in semantic_search_batch: %s", e)
+            error = {"status": "error", "tool": "semantic_search", "error": str(e)}
+            return [dict(error) for _ in queries]
+
+    @staticmethod
+    def _section_filter(section: Optional[str]) -> Optional[Filter]:
+        """Build the Qdrant payload filter for a section (None for all sections)"""
+        if not section or section == "all":
+            return None
+        return Filter(
+            must=[
+                FieldCondition(
+                    key="section",
+                    match=MatchValue(value=section)
+                )
+            ]
+        )
+
+    @staticmethod
+    def _semantic_search_response(query: str, section: Optional[str], results: List[Any]) -> Dict[str, Any]:
+        """Format Qdrant hits as a semantic_search tool result"""
+        formatted_results = [DatabaseTools._format_semantic_hit(result) for result in results]
+
+        logger.info("Semantic search found %s results for query: '%s'", len(formatted_results), query)
+        return {
+            "status": "success",
+            "tool": "semantic_search",
+            "query": query,
+            "section_filter": section or "all",
+            "results_count": len(formatted_results),
+            "results": formatted_results
+        }
+
+    @staticmethod
+    def _format_semantic_hit(result: Any) -> Dict[str, Any]:
+        """Flatten one Qdrant hit into core fields plus section-specific metadata"""
+        payload = result.payload
+        formatted_result = {
+            "chunk_id": payload.get("chunk_id"),
+            "cv_id": payload.get("cv_id"),
+            "section": payload.get("section"),
+            "similarity_score": result.score
+        }
+
+        # Section-specific fields, then common fields, each only when non-empty
+        for key in DatabaseTools.SEMANTIC_SECTION_FIELDS.get(payload.get("section", ""), ()):
+            value = payload.get(key)
+            if value:
+                formatted_result[key] = value
+        for key in DatabaseTools.SEMANTIC_COMMON_FIELDS:
+            value = payload.get(key)
+            if value:
+                formatted_result[key] = value
+
+        return formatted_result
 
     # ========================================================================
     # TOOL 10: Get All Work Experience (Complete Career History) ⭐ PRIMARY FOR EXPERIENCE QUERIES
@@ -786,15 +942,9 @@ class DatabaseTools:
                 FROM work_experience
                 WHERE cv_id = %s
                 ORDER BY start_date DESC
-            """, (cv_id,))
-
-            # Convert dates to strings
-            for result in results:
-                for key in ["start_date", "end_date"]:
-                    if result.get(key):
-                        result[key] = str(result[key])
+            """, (cv_id,), prepared=True)
 
-            logger.info(f"Retrieved {len(results)} work experience records")
+            logger.info("Retrieved %s work experience records", len(results))
             return {
                 "status": "success",
                 "tool": "get_all_work_experience",
@@ -803,7 +953,7 @@ class DatabaseTools:
             }
 
         except Exception as e:
-            logger.error(f"Error in get_all_work_experience: {e}")
+            logger.error("Error in get_all_work_experience: %s", e)
             return {
                 "status": "error",
                 "tool": "get_all_work_experience",
@@ -820,7 +970,7 @@ class DatabaseTools:
                     FROM languages
                     WHERE cv_id = %s AND language ILIKE %s
                     ORDER BY language
-                """, (cv_id, f"%{language}%"))
+                """, (cv_id, f"%{language}%"), prepared=True)
                 search_type = f"language: {language}"
             else:
                 results = self.pg_manager.fetch_all("""
@@ -828,13 +978,13 @@ class DatabaseTools:
                     FROM languages
                     WHERE cv_id = %s
                     ORDER BY language
-                """, (cv_id,))
+                """, (cv_id,), prepared=True)
                 search_type = "all languages"
-            logger.info(f"Found {len(results)} language records for {search_type}")
+            logger.info("Found %s language records for %s", len(results), search_type)
             return {"status": "success", "tool": "search_languages",
                     "search_type": search_type, "results_count": len(results), "results": results}
         except Exception as e:
-            logger.error(f"Error in search_languages: {e}")
+            logger.error("Error in search_languages: %s", e)
             return {"status": "error", "tool": "search_languages", "error": str(e)}
 
     def get_contact_info(self) -> Dict[str, Any]:
@@ -845,7 +995,7 @@ class DatabaseTools:
                 SELECT name, email, email_alt, linkedin, github
                 FROM cv_metadata
                 WHERE id = %s
-            """, (cv_id,))
+            """, (cv_id,), prepared=True)
             if result:
                 logger.info("Contact information retrieved successfully")
                 return {"status": "success", "tool": "get_contact_info", "data": dict(result)}
@@ -853,7 +1003,7 @@ class DatabaseTools:
                 return {"status": "error", "tool": "get_contact_info",
                         "error": "Contact information not found"}
         except Exception as e:
-            logger.error(f"Error in get_contact_info: {e}")
+            logger.error("Error in get_contact_info: %s", e)
             return {"status": "error", "tool": "get_contact_info", "error": str(e)}
 
     def search_work_references(self, reference_name: Optional[str] = None, company: Optional[str] = None) -> Dict[str, Any]:
@@ -866,7 +1016,7 @@ class DatabaseTools:
                     FROM work_references
                     WHERE cv_id = %s AND name ILIKE %s
                     ORDER BY name
-                """, (cv_id, f"%{reference_name}%"))
+                """, (cv_id, f"%{reference_name}%"), prepared=True)
                 search_type = f"name: {reference_name}"
             elif company:
                 results = self.pg_manager.fetch_all("""
@@ -874,7 +1024,7 @@ class DatabaseTools:
                     FROM work_references
                     WHERE cv_id = %s AND company ILIKE %s
                     ORDER BY name
-                """, (cv_id, f"%{company}%"))
+                """, (cv_id, f"%{company}%"), prepared=True)
                 search_type = f"company: {company}"
             else:
                 results = self.pg_manager.fetch_all("""
@@ -882,13 +1032,13 @@ class DatabaseTools:
                     FROM work_references
                     WHERE cv_id = %s
                     ORDER BY name
-                """, (cv_id,))
+                """, (cv_id,), prepared=True)
                 search_type = "all references"
-            logger.info(f"Found {len(results)} work reference records for {search_type}")
+            logger.info("Found %s work reference records for %s", len(results), search_type)
             return {"status": "success", "tool": "search_work_references",
                     "search_type": search_type, "results_count": len(results), "results": results}
         except Exception as e:
-            logger.error(f"Error in search_work_references: {e}")
+            logger.error("Error in search_work_references: %s", e)
             return {"status": "error", "tool": "search_work_references", "error": str(e)}
 
 
@@ -904,10 +1054,10 @@ def create_mcp_server():
         logger.info("MCP Server initialized successfully")
         return tools
     except MCPServerError as e:
-        logger.error(f"MCP Server initialization error: {e}")
+        logger.error("MCP Server initialization error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Failed to initialize MCP Server: {e}")
+        logger.error("Failed to initialize MCP Server: %s", e)
         raise MCPServerError(f"MCP Server initialization failed: {str(e)}")
 
 
@@ -1,3 +1,5 @@
+import re
+
 SYSTEM_PROMPT = """You are Pattreeya's professional voice assistant. Answer ONLY questions about her career, education, skills, and achievements.
 
 CRITICAL RULES:
@@ -46,6 +48,9 @@ STEP 4: RESPOND
 TOOL SELECTION DECISION TREE
 ═══════════════════════════════════════════════════════════
 
+Question mentions BOTH a specific COMPANY and a TECHNOLOGY?
+  → search_experience(company_name, technology) [runs both lookups at once]
+
 Question mentions a specific COMPANY (KasiOss, AgBrain, etc.)?
   → search_company_experience(company_name) [PRIMARY]
   → THEN semantic_search("company responsibilities achievements") for detailed role info
@@ -274,3 +279,24 @@ TENSE HINTS:
 
 Return ONLY the category name (e.g., "Work Experience"), nothing else.
 """
+
+
+# Lines made only of box-drawing / rule characters (visual separators)
+_RULE_LINE = re.compile(r"^\s*[═━─=\-_*]{3,}\s*$")
+
+
+def compact_prompt(prompt: str) -> str:
+    """
+    Strip token-heavy formatting that carries no meaning for the LLM
+
+    Removes decorative rule lines, trailing whitespace and repeated blank lines.
+    Indentation is kept (it encodes the decision-tree structure).
+
+    Args:
+        prompt: Prompt text as written in this module
+
+    Returns:
+        Compacted prompt text
+    """
+    lines = [line.rstrip() for line in prompt.strip().splitlines() if not _RULE_LINE.match(line)]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines))
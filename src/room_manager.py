@@ -5,6 +5,7 @@ Handles creation and management of rooms with 'pattreeya' prefix
 
 import asyncio
 import logging
+import threading
 from datetime import datetime
 from typing import Optional
 from livekit.api import LiveKitAPI
@@ -81,12 +82,12 @@ class RoomManager:
             )
 
             logger.info(
-                f"Created room '{room_name}' with max {max_participants} participants"
+                "Created room '%s' with max %s participants", room_name, max_participants
             )
             return room_name
 
         except Exception as e:
-            logger.error(f"Failed to create room: {e}")
+            logger.error("Failed to create room: %s", e)
             raise
 
     async def delete_pattreeya_room(self, room_name: str) -> bool:
@@ -104,17 +105,17 @@ class RoomManager:
         """
         try:
             if not room_name.startswith("pattreeya-"):
-                logger.warning(f"Room '{room_name}' does not start with 'pattreeya-'")
+                logger.warning("Room '%s' does not start with 'pattreeya-'", room_name)
 
             from livekit.api.room_service import DeleteRoomRequest
 
             api = await self._get_api()
             await api.room.delete_room(req=DeleteRoomRequest(room=room_name))
-            logger.info(f"Deleted room '{room_name}'")
+            logger.info("Deleted room '%s'", room_name)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to delete room '{room_name}': {e}")
+            logger.error("Failed to delete room '%s': %s", room_name, e)
             raise
 
     async def list_pattreeya_rooms(self) -> list[str]:
@@ -134,11 +135,11 @@ class RoomManager:
                 for room in response.rooms
                 if room.name.startswith("pattreeya-")
             ]
-            logger.info(f"Found {len(pattreeya_rooms)} pattreeya rooms")
+            logger.info("Found %s pattreeya rooms", len(pattreeya_rooms))
             return pattreeya_rooms
 
         except Exception as e:
-            logger.error(f"Failed to list rooms: {e}")
+            logger.error("Failed to list rooms: %s", e)
             return []
 
     async def room_exists(self, room_name: str) -> bool:
@@ -159,19 +160,22 @@ class RoomManager:
             return any(room.name == room_name for room in response.rooms)
 
         except Exception as e:
-            logger.error(f"Failed to check if room exists: {e}")
+            logger.error("Failed to check if room exists: %s", e)
             return False
 
 
 # Global singleton instance
 _room_manager_instance: Optional[RoomManager] = None
+_room_manager_lock = threading.Lock()
 
 
 def get_room_manager(config=None) -> RoomManager:
-    """Get or create the global RoomManager instance"""
+    """Get or create the global RoomManager instance (thread-safe)"""
     global _room_manager_instance
     if _room_manager_instance is None:
-        _room_manager_instance = RoomManager(config)
+        with _room_manager_lock:
+            if _room_manager_instance is None:
+                _room_manager_instance = RoomManager(config)
     return _room_manager_instance
 
 
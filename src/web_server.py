@@ -95,7 +95,7 @@ def create_app(
                 }
             )
         except Exception as e:
-            logger.error(f"Error generating connection details: {e}")
+            logger.error("Error generating connection details: %s", e)
             import traceback
             logger.error(traceback.format_exc())
             return jsonify({"error": str(e)}), 500
@@ -161,13 +161,13 @@ def run_web_server(
     )
 
     def run():
-        logger.info(f"Starting web server on {host}:{port}")
+        logger.info("Starting web server on %s:%s", host, port)
         if static_files_path:
-            logger.info(f"Serving static files from {static_files_path}")
+            logger.info("Serving static files from %s", static_files_path)
         app.run(host=host, port=port, debug=debug, use_reloader=False)
 
     thread = threading.Thread(target=run, daemon=True)
     thread.start()
 
-    logger.info(f"Web server started on http://{host}:{port}")
+    logger.info("Web server started on http://%s:%s", host, port)
     return thread
\ No newline at end of file
@@ -3,8 +3,10 @@ Integration tests for Voice Agent with MCP Client
 Tests agent initialization and tool integration
 """
 
+import asyncio
 import pytest
 import logging
+import time
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import sys
 import os
@@ -12,7 +14,8 @@ import os
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from agent import Assistant
+from agent import Assistant, CircuitBreaker, MCP_TOOL_BREAKERS, warm_embedding_client
+from cache import CachedMCPClient, ToolResultCache
 from config import ConfigManager
 from mcp_client import MCPClient
 
@@ -278,6 +281,17 @@ class TestAssistantToolInvocations:
         assert 'Python' in result
         mock_mcp_client.search_technology_experience.assert_called_once_with("Python")
 
+    async def test_search_experience_invocation(self, mock_mcp_client):
+        """Test that search_experience runs the company and technology lookups"""
+        assistant = Assistant(mcp_client=mock_mcp_client)
+        context = Mock()
+
+        result = await assistant.search_experience(context, "TechCorp", "Python")
+
+        assert 'TechCorp' in result and 'Python' in result
+        mock_mcp_client.search_company_experience.assert_called_once_with("TechCorp")
+        mock_mcp_client.search_technology_experience.assert_called_once_with("Python")
+
     async def test_search_education_invocation(self, mock_mcp_client):
         """Test invoking search_education tool"""
         assistant = Assistant(mcp_client=mock_mcp_client)
@@ -329,6 +343,45 @@ class TestAssistantToolInvocations:
         mock_mcp_client.semantic_search.assert_called_once()
 
 
+@pytest.mark.asyncio
+class TestAssistantToolCaching:
+    """Tests for tool calls through the in-memory and persistent result caches"""
+
+    async def test_memory_tier_first_then_persistent(self, mock_mcp_client, tmp_path):
+        """Test repeats hit the LRU, and a new process is served from sqlite"""
+        tool_cache = ToolResultCache(str(tmp_path / "tools.db"), ttl=300.0)
+        cached = CachedMCPClient(mock_mcp_client, ttl=300.0, persistent=tool_cache)
+        assistant = Assistant(mcp_client=cached)
+        context = Mock()
+
+        first = await assistant.search_skills(context, "ML")
+        second = await assistant.search_skills(context, "ML")
+
+        assert first == second
+        assert cached.hits == 1
+        mock_mcp_client.search_skills.assert_called_once_with("ML")
+
+        # Fresh LRU (another worker process) sharing the same sqlite file
+        restarted = CachedMCPClient(mock_mcp_client, ttl=300.0, persistent=tool_cache)
+        result = await Assistant(mcp_client=restarted).search_skills(context, "ML")
+
+        assert result == first
+        assert mock_mcp_client.search_skills.call_count == 1
+        assert len(restarted) == 1
+        tool_cache.close()
+
+    async def test_persistent_tier_honours_memory_ttl(self, mock_mcp_client, tmp_path):
+        """Test a result older than the LRU TTL is not revived from sqlite"""
+        tool_cache = ToolResultCache(str(tmp_path / "tools.db"), ttl=86400.0)
+        context = Mock()
+
+        stale = CachedMCPClient(mock_mcp_client, ttl=-1.0, persistent=tool_cache)
+        await Assistant(mcp_client=stale).search_skills(context, "ML")
+        await Assistant(mcp_client=stale).search_skills(context, "ML")
+
+        assert mock_mcp_client.search_skills.call_count == 2
+        tool_cache.close()
+
 @pytest.mark.asyncio
 class TestAssistantErrorHandling:
     """Tests for error handling in Assistant tools"""
@@ -343,6 +396,22 @@ class TestAssistantErrorHandling:
 
         assert 'Error' in result
 
+    async def test_repeated_failures_open_circuit(self, mock_mcp_client):
+        """Test that a failing tool is short-circuited after repeated errors"""
+        mock_mcp_client.search_languages.side_effect = Exception("DB Error")
+        assistant = Assistant(mcp_client=mock_mcp_client)
+        context = Mock()
+
+        try:
+            for _ in range(5):
+                await assistant.search_languages(context)
+            result = await assistant.search_languages(context)
+
+            assert 'temporarily unavailable' in result
+            assert mock_mcp_client.search_languages.call_count == 5
+        finally:
+            MCP_TOOL_BREAKERS['search_languages'].reset()
+
     async def test_tool_failure_response(self, mock_mcp_client):
         """Test tool handling of failure responses"""
         mock_mcp_client.search_company_experience.return_value = {
@@ -370,6 +439,110 @@ class TestAssistantErrorHandling:
         assert 'No experience found' in result
 
 
+@pytest.mark.asyncio
+class TestAssistantRoomTools:
+    """Tests for the batched room management tool"""
+
+    @pytest.fixture
+    def mock_room_manager(self):
+        """Create a mock room manager"""
+        room_manager = Mock()
+        room_manager.list_pattreeya_rooms = AsyncMock(return_value=["pattreeya-a", "pattreeya-b"])
+        room_manager.create_pattreeya_room = AsyncMock(return_value="pattreeya-demo")
+        room_manager.delete_pattreeya_room = AsyncMock(return_value=True)
+        return room_manager
+
+    async def test_manage_rooms_dispatches_each_action(self, mock_mcp_client, mock_room_manager):
+        """Test that list, create and delete actions reach the matching room manager call"""
+        assistant = Assistant(mcp_client=mock_mcp_client, room_manager=mock_room_manager)
+        context = Mock()
+
+        result = await assistant.manage_pattreeya_rooms(
+            context, ["list", "create:demo", "delete: pattreeya-old"]
+        )
+
+        mock_room_manager.list_pattreeya_rooms.assert_awaited_once()
+        mock_room_manager.create_pattreeya_room.assert_awaited_once_with(room_name_suffix="demo")
+        mock_room_manager.delete_pattreeya_room.assert_awaited_once_with("pattreeya-old")
+        parts = result.split(" | ")
+        assert parts[0] == "list: Currently active pattreeya rooms: pattreeya-a, pattreeya-b"
+        assert parts[1].startswith("create:demo: Successfully created room: pattreeya-demo")
+        assert parts[2] == "delete: pattreeya-old: Successfully deleted room: pattreeya-old"
+
+    async def test_create_without_suffix(self, mock_mcp_client, mock_room_manager):
+        """Test that a bare create passes no suffix"""
+        assistant = Assistant(mcp_client=mock_mcp_client, room_manager=mock_room_manager)
+
+        await assistant.manage_pattreeya_rooms(Mock(), ["CREATE"])
+
+        mock_room_manager.create_pattreeya_room.assert_awaited_once_with(room_name_suffix=None)
+
+    async def test_unknown_room_action(self, mock_mcp_client, mock_room_manager):
+        """Test that unrecognised actions and a delete without a name are reported, not run"""
+        assistant = Assistant(mcp_client=mock_mcp_client, room_manager=mock_room_manager)
+
+        result = await assistant.manage_pattreeya_rooms(Mock(), ["rename:foo", "delete"])
+
+        assert result == "rename:foo: Unknown room action: rename:foo | delete: Unknown room action: delete"
+        mock_room_manager.delete_pattreeya_room.assert_not_called()
+        mock_room_manager.create_pattreeya_room.assert_not_called()
+
+    async def test_one_failure_does_not_cancel_the_rest(self, mock_mcp_client, mock_room_manager):
+        """Test that a failing action reports its error while the others still run"""
+        mock_room_manager.delete_pattreeya_room.side_effect = Exception("room not found")
+        assistant = Assistant(mcp_client=mock_mcp_client, room_manager=mock_room_manager)
+
+        result = await assistant.manage_pattreeya_rooms(Mock(), ["delete:pattreeya-x", "list"])
+
+        assert "delete:pattreeya-x: Failed to delete room: room not found" in result
+        assert "list: Currently active pattreeya rooms" in result
+
+
+class TestCircuitBreaker:
+    """Tests for the per-tool circuit breaker"""
+
+    def test_half_open_admits_a_single_trial(self):
+        """Test that only one caller gets through once the cooldown has passed"""
+        breaker = CircuitBreaker(threshold=1, cooldown=30.0)
+        breaker.record(False)
+        assert not breaker.allow()
+
+        breaker.open_until = time.monotonic() - 1.0  # cooldown elapsed
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record(True)
+        assert breaker.allow() and breaker.allow()
+
+    def test_failed_trial_reopens(self):
+        """Test that a failing trial call reopens the breaker at once"""
+        breaker = CircuitBreaker(threshold=5, cooldown=30.0)
+        for _ in range(5):
+            breaker.record(False)
+
+        breaker.open_until = time.monotonic() - 1.0
+        assert breaker.allow()
+        breaker.record(False)
+
+        assert not breaker.allow()
+
+
+class TestEmbeddingWarmup:
+    """Tests for the per-session async embedding warmup"""
+
+    async def test_slow_warmup_gives_up(self):
+        """Test that a hung warmup is abandoned after the timeout instead of blocking"""
+        async def hang():
+            await asyncio.sleep(60)
+
+        client = Mock()
+        client.awarmup = AsyncMock(side_effect=hang)
+
+        with patch('agent.MCP_TOOL_TIMEOUT', 0.01):
+            await asyncio.wait_for(warm_embedding_client(client), timeout=1.0)
+
+        client.awarmup.assert_awaited_once_with()
+
 class TestAssistantIntegration:
     """Integration tests for Assistant with MCP Client"""
 
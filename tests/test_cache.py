@@ -0,0 +1,486 @@
+"""
+Tests for cache module
+Tests exact-match and semantic caching of MCP tool results
+"""
+
+import asyncio
+import pytest
+import logging
+from unittest.mock import AsyncMock, Mock
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cache import CachedMCPClient, RequestCoalescer, SemanticSearchCache, EmbeddingCache, ToolResultCache
+
+logger = logging.getLogger(__name__)
+
+
+SUCCESS_RESULT = {
+    'status': 'success',
+    'tool': 'semantic_search',
+    'results_count': 1,
+    'results': [{'section': 'work experience', 'company': 'TechCorp'}]
+}
+
+
+@pytest.fixture
+def cache():
+    """Create an empty SemanticSearchCache"""
+    return SemanticSearchCache(maxsize=4, ttl=60.0, similarity_threshold=0.92)
+
+
+@pytest.mark.asyncio
+class TestSemanticSearchCache:
+    """Tests for SemanticSearchCache.get_or_compute"""
+
+    async def test_exact_hit_skips_embedding_and_search(self, cache):
+        """Test that an identical query is served from the exact-match layer"""
+        embed = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        compute = AsyncMock(return_value=SUCCESS_RESULT)
+
+        first = await cache.get_or_compute("python skills", None, 5, embed, compute)
+        second = await cache.get_or_compute("Python skills ", None, 5, embed, compute)
+
+        assert first == second == SUCCESS_RESULT
+        embed.assert_awaited_once()
+        compute.assert_awaited_once_with([1.0, 0.0, 0.0])
+        assert cache.hits == 1
+
+    async def test_semantic_hit_for_paraphrased_query(self, cache):
+        """Test that a near-duplicate embedding reuses the cached result"""
+        embed = AsyncMock(side_effect=[[1.0, 0.0, 0.0], [0.99, 0.05, 0.0]])
+        compute = AsyncMock(return_value=SUCCESS_RESULT)
+
+        await cache.get_or_compute("what tech does she use", None, 5, embed, compute)
+        result = await cache.get_or_compute("which technologies", None, 5, embed, compute)
+
+        assert result == SUCCESS_RESULT
+        compute.assert_awaited_once()
+        assert cache.semantic_hits == 1
+
+    async def test_semantic_hit_keeps_source_age(self, cache):
+        """Test that a result re-stored for a paraphrase keeps its original created_at"""
+        embed = AsyncMock(side_effect=[[1.0, 0.0, 0.0], [0.99, 0.05, 0.0]])
+        compute = AsyncMock(return_value=SUCCESS_RESULT)
+
+        await cache.get_or_compute("what tech does she use", None, 5, embed, compute)
+        await cache.get_or_compute("which technologies", None, 5, embed, compute)
+
+        source = cache._entries[cache.make_key("what tech does she use", None, 5)]
+        paraphrase = cache._entries[cache.make_key("which technologies", None, 5)]
+        assert paraphrase["created_at"] == source["created_at"]
+
+    async def test_expired_source_is_not_a_semantic_hit(self):
+        """Test that an entry past its TTL is not served to a paraphrase"""
+        cache = SemanticSearchCache(ttl=60.0)
+        embed = AsyncMock(side_effect=[[1.0, 0.0, 0.0], [0.99, 0.05, 0.0]])
+        compute = AsyncMock(return_value=SUCCESS_RESULT)
+
+        await cache.get_or_compute("what tech does she use", None, 5, embed, compute)
+        for entry in cache._entries.values():
+            entry["created_at"] -= 120.0
+        await cache.get_or_compute("which technologies", None, 5, embed, compute)
+
+        assert compute.await_count == 2
+        assert cache.semantic_hits == 0
+
+    async def test_semantic_layer_respects_section(self, cache):
+        """Test that a similar query with a different section filter is a miss"""
+        embed = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        compute = AsyncMock(return_value=SUCCESS_RESULT)
+
+        await cache.get_or_compute("projects", "projects", 5, embed, compute)
+        await cache.get_or_compute("projects", "education", 5, embed, compute)
+
+        assert compute.await_count == 2
+
+    async def test_dissimilar_query_is_a_miss(self, cache):
+        """Test that an unrelated embedding computes a fresh result"""
+        embed = AsyncMock(side_effect=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        compute = AsyncMock(return_value=SUCCESS_RESULT)
+
+        await cache.get_or_compute("python", None, 5, embed, compute)
+        await cache.get_or_compute("publications", None, 5, embed, compute)
+
+        assert compute.await_count == 2
+        assert cache.misses == 2
+
+    async def test_error_results_are_not_cached(self, cache):
+        """Test that failed searches are recomputed on the next call"""
+        embed = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        compute = AsyncMock(return_value={'status': 'error', 'error': 'Qdrant down'})
+
+        await cache.get_or_compute("python", None, 5, embed, compute)
+        await cache.get_or_compute("python", None, 5, embed, compute)
+
+        assert compute.await_count == 2
+        assert len(cache) == 0
+
+    async def test_embedding_failure_falls_back_to_exact_cache(self, cache):
+        """Test that an embedding error still runs the search without a vector"""
+        embed = AsyncMock(side_effect=Exception("Embedding API error"))
+        compute = AsyncMock(return_value=SUCCESS_RESULT)
+
+        result = await cache.get_or_compute("python", None, 5, embed, compute)
+
+        assert result == SUCCESS_RESULT
+        compute.assert_awaited_once_with(None)
+
+    async def test_concurrent_identical_calls_are_coalesced(self, cache):
+        """Test that parallel identical searches share one computation"""
+        embed = AsyncMock(return_value=[1.0, 0.0, 0.0])
+
+        async def slow_compute(vector):
+            await asyncio.sleep(0.01)
+            return SUCCESS_RESULT
+
+        compute = AsyncMock(side_effect=slow_compute)
+
+        results = await asyncio.gather(
+            cache.get_or_compute("python", None, 5, embed, compute),
+            cache.get_or_compute("python", None, 5, embed, compute),
+        )
+
+        assert results == [SUCCESS_RESULT, SUCCESS_RESULT]
+        compute.assert_awaited_once()
+        assert cache.coalesced == 1
+
+    async def test_cancelled_first_caller_does_not_cancel_waiters(self, cache):
+        """Test that cancelling the caller that started a search leaves it running for the others"""
+        embed = AsyncMock(return_value=[1.0, 0.0, 0.0])
+
+        async def slow_compute(vector):
+            await asyncio.sleep(0.01)
+            return SUCCESS_RESULT
+
+        compute = AsyncMock(side_effect=slow_compute)
+
+        first = asyncio.ensure_future(cache.get_or_compute("python", None, 5, embed, compute))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_or_compute("python", None, 5, embed, compute))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == SUCCESS_RESULT
+        assert first.cancelled()
+        compute.assert_awaited_once()
+        assert not cache._inflight
+
+
+class TestSemanticSearchCacheEviction:
+    """Tests for LRU and TTL eviction"""
+
+    def test_lru_eviction(self, cache):
+        """Test that the least recently used entry is evicted at maxsize"""
+        for i in range(5):
+            cache.put(cache.make_key(f"query {i}", None, 5), SUCCESS_RESULT)
+
+        assert len(cache) == 4
+        assert cache.get(cache.make_key("query 0", None, 5)) is None
+        assert cache.get(cache.make_key("query 4", None, 5)) == SUCCESS_RESULT
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are not returned"""
+        cache = SemanticSearchCache(ttl=-1.0)
+        key = cache.make_key("python", None, 5)
+        cache.put(key, SUCCESS_RESULT)
+
+        assert cache.get(key) is None
+
+    def test_evicted_slot_is_reused_for_semantic_lookup(self, cache):
+        """Test that an evicted entry's embedding no longer produces semantic hits"""
+        vectors = np.eye(5, dtype=np.float32)
+        for i in range(5):
+            cache.put(cache.make_key(f"query {i}", None, 5), {'status': 'success', 'id': i},
+                      vectors[i], None, 5)
+
+        assert cache.get_similar(vectors[0], None, 5) is None
+        assert cache.get_similar(vectors[4], None, 5) == {'status': 'success', 'id': 4}
+
+
+@pytest.mark.asyncio
+class TestRequestCoalescer:
+    """Tests for batching concurrent requests within a window"""
+
+    async def test_concurrent_requests_share_one_batch(self):
+        """Test that requests in one window are dispatched as a single batch call"""
+        single = AsyncMock()
+        batch = AsyncMock(side_effect=lambda items: [item.upper() for item in items])
+        coalescer = RequestCoalescer(single, batch, window=0.01)
+
+        results = await asyncio.gather(
+            coalescer.submit("a", "a"),
+            coalescer.submit("b", "b"),
+            coalescer.submit("a", "a"),
+        )
+
+        assert results == ["A", "B", "A"]
+        batch.assert_awaited_once_with(["a", "b"])
+        single.assert_not_awaited()
+        assert coalescer.deduplicated == 1
+
+    async def test_lone_request_uses_single_call(self):
+        """Test that a window with one request skips the batch path"""
+        single = AsyncMock(return_value="A")
+        batch = AsyncMock()
+        coalescer = RequestCoalescer(single, batch, window=0.0)
+
+        assert await coalescer.submit("a", "a") == "A"
+        batch.assert_not_awaited()
+
+    async def test_max_batch_flushes_early(self):
+        """Test that reaching max_batch dispatches without waiting for the window"""
+        batch = AsyncMock(side_effect=lambda items: items)
+        coalescer = RequestCoalescer(AsyncMock(), batch, window=60.0, max_batch=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(coalescer.submit(1, 1), coalescer.submit(2, 2)), timeout=1.0
+        )
+
+        assert results == [1, 2]
+
+    async def test_batch_error_reaches_every_caller(self):
+        """Test that a failed batch call raises in each waiting request"""
+        batch = AsyncMock(side_effect=Exception("Embedding API error"))
+        coalescer = RequestCoalescer(AsyncMock(), batch, window=0.01)
+
+        results = await asyncio.gather(
+            coalescer.submit("a", "a"), coalescer.submit("b", "b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, Exception) for r in results)
+
+
+    async def test_short_batch_fails_every_caller(self):
+        """Test that a batch returning too few results does not leave callers waiting"""
+        batch = AsyncMock(side_effect=lambda items: items[:1])
+        coalescer = RequestCoalescer(AsyncMock(), batch, window=0.01)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                coalescer.submit("a", "a"), coalescer.submit("b", "b"), return_exceptions=True
+            ),
+            timeout=1.0,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_dispatch_fails_every_caller(self):
+        """Test that cancelling the batch call resolves the waiting requests"""
+        started = asyncio.Event()
+
+        async def hang(items):
+            started.set()
+            await asyncio.Event().wait()
+
+        coalescer = RequestCoalescer(AsyncMock(), hang, window=0.0)
+        callers = asyncio.gather(
+            coalescer.submit("a", "a"), coalescer.submit("b", "b"), return_exceptions=True
+        )
+        await started.wait()
+        for task in list(coalescer._tasks):
+            task.cancel()
+
+        results = await asyncio.wait_for(callers, timeout=1.0)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+class TestCachedMCPClient:
+    """Tests for the CachedMCPClient proxy"""
+
+    def test_repeated_call_is_served_from_cache(self):
+        """Test that an identical tool call skips the MCP client"""
+        client = Mock()
+        client.search_publications.return_value = SUCCESS_RESULT
+        cached = CachedMCPClient(client)
+
+        assert cached.search_publications(2023) == SUCCESS_RESULT
+        assert cached.search_publications(2023) == SUCCESS_RESULT
+
+        client.search_publications.assert_called_once_with(2023)
+        assert cached.hits == 1
+
+    def test_tool_wrapper_is_bound_once(self):
+        """Test that repeated lookups of a cached tool return the same wrapper"""
+        client = Mock()
+        cached = CachedMCPClient(client)
+
+        assert cached.search_skills is cached.search_skills
+        assert cached.semantic_search is client.semantic_search
+
+    def test_expired_results_are_recomputed(self):
+        """Test that a result past its per-tool TTL hits the MCP client again"""
+        client = Mock()
+        client.get_cv_summary.return_value = SUCCESS_RESULT
+        client.search_skills.return_value = SUCCESS_RESULT
+        cached = CachedMCPClient(client, tool_ttls={'get_cv_summary': -1.0})
+
+        cached.get_cv_summary()
+        cached.get_cv_summary()
+        cached.search_skills("AI")
+        cached.search_skills("AI")
+
+        assert client.get_cv_summary.call_count == 2
+        assert client.search_skills.call_count == 1
+
+    def test_case_insensitive_tools_share_entries(self):
+        """Test that ILIKE-backed tools normalize case and whitespace"""
+        client = Mock()
+        client.search_company_experience.return_value = SUCCESS_RESULT
+        cached = CachedMCPClient(client)
+
+        cached.search_company_experience("TechCorp ")
+        cached.search_company_experience("techcorp")
+
+        client.search_company_experience.assert_called_once_with("TechCorp")
+
+    def test_persistent_tier_uses_the_same_key(self, tmp_path):
+        """Test that a case variant is served from sqlite by a fresh LRU"""
+        client = Mock()
+        client.search_company_experience.return_value = SUCCESS_RESULT
+        tool_cache = ToolResultCache(str(tmp_path / "tools.db"))
+
+        CachedMCPClient(client, persistent=tool_cache).search_company_experience("TechCorp")
+        CachedMCPClient(client, persistent=tool_cache).search_company_experience("TECHCORP")
+
+        client.search_company_experience.assert_called_once_with("TechCorp")
+        assert tool_cache.get("search_company_experience", ["techcorp"]) == SUCCESS_RESULT
+        tool_cache.close()
+
+    def test_case_sensitive_tools_keep_case(self):
+        """Test that exact-match tools do not fold case"""
+        client = Mock()
+        client.search_skills.return_value = SUCCESS_RESULT
+        cached = CachedMCPClient(client)
+
+        cached.search_skills("AI")
+        cached.search_skills("ai")
+
+        assert client.search_skills.call_count == 2
+
+    def test_errors_and_uncached_tools_pass_through(self):
+        """Test that errors are not cached and semantic_search is not memoized"""
+        client = Mock()
+        client.get_cv_summary.return_value = {'status': 'error', 'error': 'DB down'}
+        client.semantic_search.return_value = SUCCESS_RESULT
+        cached = CachedMCPClient(client)
+
+        cached.get_cv_summary()
+        cached.get_cv_summary()
+        cached.semantic_search("python", None, 5)
+        cached.semantic_search("python", None, 5)
+
+        assert client.get_cv_summary.call_count == 2
+        assert client.semantic_search.call_count == 2
+        assert len(cached) == 0
+
+
+class TestEmbeddingCache:
+    """Tests for the SQLite-backed EmbeddingCache"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that stored embeddings are returned on lookup"""
+        cache = EmbeddingCache(str(tmp_path / "embeddings.db"), model="test-model")
+        cache.put_many(["python"], [[0.5, 0.25, -1.0]])
+
+        assert cache.get_many(["python", "java"]) == [[0.5, 0.25, -1.0], None]
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that embeddings survive a restart"""
+        path = str(tmp_path / "embeddings.db")
+        EmbeddingCache(path, model="test-model").put_many(["python"], [[1.0, 0.0]])
+
+        assert EmbeddingCache(path, model="test-model").get_many(["python"]) == [[1.0, 0.0]]
+
+    def test_keys_are_model_specific(self, tmp_path):
+        """Test that a different embedding model does not reuse vectors"""
+        path = str(tmp_path / "embeddings.db")
+        EmbeddingCache(path, model="model-a").put_many(["python"], [[1.0, 0.0]])
+
+        assert EmbeddingCache(path, model="model-b").get_many(["python"]) == [None]
+
+    def test_recent_embeddings_kept_in_memory(self, tmp_path):
+        """Test that the in-memory layer is bounded and refilled from the database"""
+        cache = EmbeddingCache(str(tmp_path / "embeddings.db"), model="test-model", memory_size=1)
+        cache.put_many(["python", "java"], [[1.0, 0.0], [0.0, 1.0]])
+
+        assert len(cache._memory) == 1
+        assert cache.get_many(["python"]) == [[1.0, 0.0]]
+        assert list(cache._memory) == [cache._hash("python")]
+
+    def test_memory_only_lookup_skips_database(self, tmp_path):
+        """Test that a memory-only probe does not read rows that are only on disk"""
+        path = str(tmp_path / "embeddings.db")
+        EmbeddingCache(path, model="test-model").put_many(["python"], [[1.0, 0.0]])
+        cache = EmbeddingCache(path, model="test-model")
+
+        assert cache.get_many(["python"], memory_only=True) == [None]
+        assert cache.get_many(["python"]) == [[1.0, 0.0]]
+        assert cache.get_many(["python"], memory_only=True) == [[1.0, 0.0]]
+
+    def test_disabled_without_path(self):
+        """Test that an empty path disables the cache"""
+        cache = EmbeddingCache("", model="test-model")
+        cache.put_many(["python"], [[1.0, 0.0]])
+
+        assert not cache.enabled
+        assert cache.get_many(["python"]) == [None]
+
+
+class TestToolResultCache:
+    """Tests for the SQLite-backed ToolResultCache"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a successful result is returned for the same arguments"""
+        cache = ToolResultCache(str(tmp_path / "tools.db"))
+        cache.put("search_publications", {"year": 2023}, SUCCESS_RESULT)
+
+        assert cache.get("search_publications", {"year": 2023}) == SUCCESS_RESULT
+        assert cache.get("search_publications", {"year": 2022}) is None
+
+    def test_error_results_are_not_stored(self, tmp_path):
+        """Test that error results are never cached"""
+        cache = ToolResultCache(str(tmp_path / "tools.db"))
+        cache.put("get_cv_summary", {}, {'status': 'error', 'error': 'DB down'})
+
+        assert cache.get("get_cv_summary", {}) is None
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test that expired results are not returned"""
+        cache = ToolResultCache(str(tmp_path / "tools.db"), ttl=-10.0)
+        cache.put("get_cv_summary", {}, SUCCESS_RESULT)
+
+        assert cache.get("get_cv_summary", {}) is None
+
+    def test_namespaces_are_isolated(self, tmp_path):
+        """Test that caches for different data sources do not mix"""
+        path = str(tmp_path / "tools.db")
+        ToolResultCache(path, namespace="db-a").put("get_cv_summary", {}, SUCCESS_RESULT)
+
+        assert ToolResultCache(path, namespace="db-b").get("get_cv_summary", {}) is None
+
+
+    def test_expired_rows_are_purged(self, tmp_path):
+        """Test that expired rows are deleted on open, not just skipped on read"""
+        path = str(tmp_path / "tools.db")
+        cache = ToolResultCache(path)
+        cache.put("get_cv_summary", {}, SUCCESS_RESULT)
+        cache.put("search_skills", {"skill": "AI"}, SUCCESS_RESULT)
+        cache._conn.execute("UPDATE tool_cache SET ts = ts - 3600")
+        cache._conn.commit()
+        cache.close()
+
+        reopened = ToolResultCache(path, ttl=60.0)
+        rows = reopened._conn.execute("SELECT COUNT(*) FROM tool_cache").fetchone()[0]
+
+        assert rows == 0
+        assert reopened.purge_expired() == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
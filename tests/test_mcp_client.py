@@ -5,7 +5,7 @@ Tests client wrapper for MCP database tools
 
 import pytest
 import logging
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import sys
 import os
 
@@ -34,6 +34,7 @@ def mock_config():
 def mock_database_tools():
     """Create a mock DatabaseTools instance"""
     tools = Mock()
+    tools.get_cv_id.return_value = "123e4567-e89b-12d3-a456-426614174000"
     tools.get_cv_summary.return_value = {
         'status': 'success',
         'summary': {'name': 'John Doe', 'role': 'Engineer'}
@@ -206,6 +207,45 @@ class TestMCPClientTools:
         assert result['status'] == 'success'
         mock_database_tools.semantic_search.assert_called_once_with("machine learning experience", None, 5)
 
+    @patch('mcp_client.DatabaseTools')
+    def test_semantic_search_batch(self, mock_db_tools_class, mock_config, mock_database_tools):
+        """Test semantic_search_batch delegates all queries in one call"""
+        mock_db_tools_class.return_value = mock_database_tools
+        mock_database_tools.semantic_search_batch.return_value = [{'status': 'success'}] * 2
+        client = MCPClient(config=mock_config)
+
+        result = client.semantic_search_batch(["python", "publications"], [None, "publication"], [5, 3])
+
+        assert len(result) == 2
+        mock_database_tools.semantic_search_batch.assert_called_once_with(
+            ["python", "publications"], [None, "publication"], [5, 3], None
+        )
+
+    @pytest.mark.asyncio
+    @patch('mcp_client.DatabaseTools')
+    async def test_aembed_query(self, mock_db_tools_class, mock_config, mock_database_tools):
+        """Test aembed_query awaits the async embedding path"""
+        mock_db_tools_class.return_value = mock_database_tools
+        mock_database_tools.aembed_queries = AsyncMock(return_value=[[0.1, 0.2]])
+        client = MCPClient(config=mock_config)
+
+        result = await client.aembed_query("python")
+
+        assert result == [0.1, 0.2]
+        mock_database_tools.aembed_queries.assert_awaited_once_with(["python"])
+
+    @pytest.mark.asyncio
+    @patch('mcp_client.DatabaseTools')
+    async def test_awarmup(self, mock_db_tools_class, mock_config, mock_database_tools):
+        """Test awarmup warms the async embedding client"""
+        mock_db_tools_class.return_value = mock_database_tools
+        mock_database_tools.awarmup = AsyncMock()
+        client = MCPClient(config=mock_config)
+
+        await client.awarmup()
+
+        mock_database_tools.awarmup.assert_awaited_once_with()
+
 
 class TestMCPClientToolRegistry:
     """Tests for MCPClient tool registry"""
@@ -326,5 +326,73 @@ class TestDatabaseToolsRowConversion:
         assert result[1] == {'id': 2, 'name': 'test2', 'value': 200}
 
 
+
+class TestSemanticSearch:
+    """Tests for DatabaseTools.semantic_search"""
+
+    @patch('mcp_server.EmbeddingCache')
+    @patch('mcp_server.get_qdrant_manager')
+    @patch('mcp_server.get_postgres_manager')
+    @patch('mcp_server.OpenAIEmbeddings')
+    def test_semantic_search_keeps_allowed_payload_fields(self, mock_embeddings, mock_get_pg,
+                                                          mock_get_qdrant, mock_cache, mock_config):
+        """Test hits carry core fields, then the section's fields, then non-empty common fields"""
+        mock_config.get_qdrant_collection.return_value = "cv_chunks"
+        mock_get_pg.return_value.execute_scalar.return_value = "test-cv-id"
+        client = mock_get_qdrant.return_value.client
+        hit = Mock(score=0.8, payload={
+            "chunk_id": "c1", "cv_id": "test-cv-id", "section": "work experience",
+            "description": "Built search", "company": "Acme", "role": "Engineer",
+            "institution": "Not for work hits", "skills": [], "text": "raw chunk text",
+        })
+        client.query_points.return_value = Mock(points=[hit])
+
+        tools = DatabaseTools(config=mock_config)
+        result = tools.semantic_search("search work", section="work experience", top_k=3,
+                                       query_vector=[0.1, 0.2])
+
+        kwargs = client.query_points.call_args.kwargs
+        assert kwargs["query"] == [0.1, 0.2] and kwargs["limit"] == 3
+        assert kwargs["query_filter"].must[0].match.value == "work experience"
+        assert result["status"] == "success" and result["results_count"] == 1
+        formatted = result["results"][0]
+        assert list(formatted) == [
+            "chunk_id", "cv_id", "section", "similarity_score", "company", "role", "description"
+        ]
+        assert formatted["similarity_score"] == 0.8
+        assert formatted["company"] == "Acme" and formatted["description"] == "Built search"
+
+class TestSemanticSearchBatch:
+    """Tests for DatabaseTools.semantic_search_batch"""
+
+    @patch('mcp_server.EmbeddingCache')
+    @patch('mcp_server.get_qdrant_manager')
+    @patch('mcp_server.get_postgres_manager')
+    @patch('mcp_server.OpenAIEmbeddings')
+    def test_semantic_search_batch_queries_points_in_one_request(self, mock_embeddings, mock_get_pg,
+                                                                 mock_get_qdrant, mock_cache, mock_config):
+        """Test all queries go to Qdrant in one query_batch_points call"""
+        mock_config.get_qdrant_collection.return_value = "cv_chunks"
+        mock_get_pg.return_value.execute_scalar.return_value = "test-cv-id"
+        client = mock_get_qdrant.return_value.client
+        hit = Mock(score=0.9, payload={"chunk_id": "c1", "cv_id": "test-cv-id", "section": "publication"})
+        client.query_batch_points.return_value = [Mock(points=[]), Mock(points=[hit])]
+
+        tools = DatabaseTools(config=mock_config)
+        results = tools.semantic_search_batch(
+            ["python", "papers"], [None, "publication"], [5, 3], [[0.1, 0.2], [0.3, 0.4]]
+        )
+
+        client.query_batch_points.assert_called_once()
+        kwargs = client.query_batch_points.call_args.kwargs
+        assert kwargs["collection_name"] == "cv_chunks"
+        first, second = kwargs["requests"]
+        assert first.query == [0.1, 0.2] and first.filter is None and first.limit == 5
+        assert second.limit == 3 and second.filter.must[0].match.value == "publication"
+        assert [r["status"] for r in results] == ["success", "success"]
+        assert results[0]["results_count"] == 0
+        assert results[1]["results"][0]["chunk_id"] == "c1"
+        assert results[1]["section_filter"] == "publication"
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])